@@ -12,6 +12,7 @@ import json
 import requests
 import boto3
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 import os
 import logging
@@ -20,6 +21,19 @@ import logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# orjson parses straight from bytes and serializes without the
+# per-character Python encoder loop; fall back to the stdlib when the
+# deployment package does not bundle it
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
 # GitHub webhook configuration
 GITHUB_TOKEN = os.environ.get('GITHUB_TOKEN')
 GITHUB_REPO = os.environ.get('GITHUB_REPO', 'getguide/immiwatch')
@@ -35,49 +49,81 @@ IRCC_URLS = [
 S3_BUCKET = os.environ.get('S3_BUCKET', 'immiwatch-draw-data')
 S3_KEY = 'last_known_draw.json'
 
+# Shared executor so the S3 read can overlap the IRCC fetch; it survives
+# across warm invocations like the clients it runs
+_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+# Module-level session: warm Lambda invocations reuse the TCP/TLS
+# connections to canada.ca and api.github.com instead of handshaking
+# on every run
+_SESSION = requests.Session()
+
+# Cache the last known draw across warm invocations: the Lambda container
+# outlives a single run, so repeat invocations skip the S3 round trip
+_UNSET = object()
+_last_known_cache = _UNSET
+
 def get_last_known_draw():
-    """Get the last known draw from S3"""
+    """Get the last known draw, from the warm cache or S3"""
+    global _last_known_cache
+    if _last_known_cache is not _UNSET:
+        return _last_known_cache
+    s3 = boto3.client('s3')
     try:
-        s3 = boto3.client('s3')
         response = s3.get_object(Bucket=S3_BUCKET, Key=S3_KEY)
-        return json.loads(response['Body'].read().decode('utf-8'))
+        # The body bytes feed the parser directly; both orjson and the
+        # stdlib accept bytes, so no intermediate decoded str is built
+        _last_known_cache = _json_loads(response['Body'].read())
+    except s3.exceptions.NoSuchKey:
+        # No stored draw yet — a definitive answer, safe to cache
+        _last_known_cache = None
     except Exception as e:
+        # Transient failure: leave the cache unset so the next invocation
+        # retries S3 instead of treating every draw on the page as new
         logger.warning(f"Could not retrieve last known draw: {e}")
         return None
+    return _last_known_cache
 
 def save_last_known_draw(draw_data):
     """Save the last known draw to S3"""
+    global _last_known_cache
     try:
         s3 = boto3.client('s3')
         s3.put_object(
             Bucket=S3_BUCKET,
             Key=S3_KEY,
-            Body=json.dumps(draw_data, indent=2),
+            Body=_json_dumps(draw_data),
             ContentType='application/json'
         )
+        _last_known_cache = draw_data
         logger.info("Saved last known draw to S3")
     except Exception as e:
         logger.error(f"Failed to save last known draw: {e}")
 
+# Pattern for draw announcements, combined into one alternation so the
+# page is scanned once instead of once per pattern.
+# This is a simplified example - you'd need to adapt based on actual IRCC
+# page structure
+_DRAW_PATTERN = re.compile(
+    r'Round of invitations.*?(\d{1,2},\d{3}).*?(\d{3,4})'
+    r'|Express Entry.*?(\d{1,2},\d{3}).*?CRS.*?(\d{3,4})'
+    r'|Invitations.*?(\d{1,2},\d{3}).*?score.*?(\d{3,4})',
+    re.IGNORECASE | re.DOTALL
+)
+
 def parse_ircc_page(html_content):
     """Parse IRCC page for draw information"""
     draws = []
-    
-    # Look for draw patterns in the HTML
-    # This is a simplified example - you'd need to adapt based on actual IRCC page structure
-    
-    # Pattern for draw announcements
-    draw_patterns = [
-        r'Round of invitations.*?(\d{1,2},\d{3}).*?(\d{3,4})',
-        r'Express Entry.*?(\d{1,2},\d{3}).*?CRS.*?(\d{3,4})',
-        r'Invitations.*?(\d{1,2},\d{3}).*?score.*?(\d{3,4})'
-    ]
-    
-    for pattern in draw_patterns:
-        matches = re.findall(pattern, html_content, re.IGNORECASE | re.DOTALL)
-        for match in matches:
-            itas = int(match[0].replace(',', ''))
-            crs = int(match[1])
+
+    for match in _DRAW_PATTERN.finditer(html_content):
+        # Each alternative carries its own group pair; only the one that
+        # matched is populated
+        groups = [g for g in match.groups() if g is not None]
+        if len(groups) >= 2:
+            # The one str->int boundary in the pipeline: values stay ints
+            # from here through the webhook payload and the S3 state
+            itas = int(groups[0].replace(',', ''))
+            crs = int(groups[1])
             
             draw_data = {
                 "draw_date": datetime.now().strftime("%Y-%m-%d"),
@@ -102,30 +148,44 @@ def parse_ircc_page(html_content):
     
     return draws
 
+# ETags seen per URL; warm invocations send If-None-Match and a 304 means
+# the page (usually the dominant download) is never transferred or parsed
+_etag_cache = {}
+
 def fetch_ircc_data():
     """Fetch data from IRCC website"""
     draws = []
-    
+
     for url in IRCC_URLS:
         try:
             logger.info(f"Fetching data from: {url}")
-            
+
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
-            
-            response = requests.get(url, headers=headers, timeout=30)
+            cached_etag = _etag_cache.get(url)
+            if cached_etag:
+                headers['If-None-Match'] = cached_etag
+
+            response = _SESSION.get(url, headers=headers, timeout=30)
+            if response.status_code == 304:
+                logger.info(f"Page unchanged (ETag match), skipping: {url}")
+                continue
             response.raise_for_status()
-            
+
+            etag = response.headers.get('ETag')
+            if etag:
+                _etag_cache[url] = etag
+
             # Parse the page for draw information
             page_draws = parse_ircc_page(response.text)
             draws.extend(page_draws)
-            
+
             logger.info(f"Found {len(page_draws)} draws from {url}")
-            
+
         except Exception as e:
             logger.error(f"Error fetching from {url}: {e}")
-    
+
     return draws
 
 def send_github_webhook(draw_data):
@@ -142,7 +202,7 @@ def send_github_webhook(draw_data):
             'client_payload': draw_data
         }
         
-        response = requests.post(GITHUB_API_URL, headers=headers, json=payload)
+        response = _SESSION.post(GITHUB_API_URL, headers=headers, json=payload)
         response.raise_for_status()
         
         logger.info(f"Webhook sent successfully for draw #{draw_data['draw_number']}")
@@ -152,45 +212,76 @@ def send_github_webhook(draw_data):
         logger.error(f"Failed to send webhook: {e}")
         return False
 
+def poll_for_new_draws():
+    """Poll stage: fetch the IRCC pages and diff against known state.
+
+    Returns (current_draws, new_draws). Kept separate from processing so
+    the two stages can be deployed as independent functions behind a
+    queue if polling frequency ever outgrows a single handler.
+    """
+    # The S3 read and the IRCC fetch are independent network calls, so
+    # run them concurrently; total wait is max(latencies), not the sum
+    last_known_future = _EXECUTOR.submit(get_last_known_draw)
+
+    # Fetch current data from IRCC
+    current_draws = fetch_ircc_data()
+    logger.info(f"Found {len(current_draws)} draws on IRCC website")
+
+    last_known = last_known_future.result()
+    # Log the identifying fields at INFO; the full dict only renders
+    # when debug logging is actually on
+    if last_known:
+        logger.info(f"Last known draw: #{last_known.get('draw_number')} ({last_known.get('draw_date')})")
+    else:
+        logger.info("Last known draw: none")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Last known draw data: {last_known}")
+
+    # Check for new draws
+    new_draws = []
+
+    for draw in current_draws:
+        # Simple comparison - you might want more sophisticated logic
+        if not last_known or (
+            draw['itas'] != last_known.get('itas') or
+            draw['crs'] != last_known.get('crs') or
+            draw['draw_date'] != last_known.get('draw_date')
+        ):
+            new_draws.append(draw)
+
+    logger.info(f"Found {len(new_draws)} new draws")
+    return current_draws, new_draws
+
+def process_new_draws(new_draws):
+    """Process stage: send webhooks for a batch of new draws.
+
+    S3 is written once for the whole batch with the latest successfully
+    sent draw instead of once per draw.
+    """
+    last_sent = None
+    for draw in new_draws:
+        logger.info(f"Processing new draw: #{draw['draw_number']} - {draw['itas']} ITAs (CRS: {draw['crs']})")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"New draw data: {draw}")
+
+        # Send webhook to GitHub
+        if send_github_webhook(draw):
+            last_sent = draw
+            logger.info(f"✅ Successfully processed draw #{draw['draw_number']}")
+        else:
+            logger.error(f"❌ Failed to process draw #{draw['draw_number']}")
+
+    if last_sent is not None:
+        save_last_known_draw(last_sent)
+
 def lambda_handler(event, context):
     """Main Lambda handler"""
     logger.info("🔄 Starting IRCC monitoring...")
     
     try:
-        # Get last known draw
-        last_known = get_last_known_draw()
-        logger.info(f"Last known draw: {last_known}")
-        
-        # Fetch current data from IRCC
-        current_draws = fetch_ircc_data()
-        logger.info(f"Found {len(current_draws)} draws on IRCC website")
-        
-        # Check for new draws
-        new_draws = []
-        
-        for draw in current_draws:
-            # Simple comparison - you might want more sophisticated logic
-            if not last_known or (
-                draw['itas'] != last_known.get('itas') or
-                draw['crs'] != last_known.get('crs') or
-                draw['draw_date'] != last_known.get('draw_date')
-            ):
-                new_draws.append(draw)
-        
-        logger.info(f"Found {len(new_draws)} new draws")
-        
-        # Process new draws
-        for draw in new_draws:
-            logger.info(f"Processing new draw: {draw}")
-            
-            # Send webhook to GitHub
-            if send_github_webhook(draw):
-                # Save as last known draw
-                save_last_known_draw(draw)
-                logger.info(f"✅ Successfully processed draw #{draw['draw_number']}")
-            else:
-                logger.error(f"❌ Failed to process draw #{draw['draw_number']}")
-        
+        current_draws, new_draws = poll_for_new_draws()
+        process_new_draws(new_draws)
+
         return {
             'statusCode': 200,
             'body': json.dumps({
@@ -199,7 +290,7 @@ def lambda_handler(event, context):
                 'new_draws': len(new_draws)
             })
         }
-        
+
     except Exception as e:
         logger.error(f"❌ Error in lambda_handler: {e}")
         return {
@@ -0,0 +1,31 @@
+"""Shared orjson/stdlib JSON shim for the automation scripts.
+
+orjson parses straight from bytes and serializes in a single C pass with
+no per-character Python encoder loop; fall back to the stdlib when it is
+not installed. Hoisted here so every script gets the same fallback
+semantics instead of five hand-copied blocks drifting apart.
+
+The Lambda (lambda/ircc_monitor.py) deploys as a standalone bundle and
+keeps its own copy of this block.
+"""
+
+import json
+
+try:
+    import orjson
+
+    loads = orjson.loads
+    dumps_bytes = orjson.dumps
+
+    def dumps_str(obj) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    loads = json.loads
+
+    # Compact separators match orjson's output: these payloads are
+    # machine-read, so the extra whitespace would only add bytes
+    def dumps_bytes(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    def dumps_str(obj) -> str:
+        return json.dumps(obj, separators=(',', ':'))
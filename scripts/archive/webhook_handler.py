@@ -4,8 +4,10 @@ ImmiWatch Webhook Handler
 Simple Flask server to receive Airtable data and process it with our automation system
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
+import hmac
 import json
+import logging
 import os
 import sys
 from pathlib import Path
@@ -13,9 +15,45 @@ from pathlib import Path
 # Add the scripts directory to the path so we can import our automation system
 sys.path.append(str(Path(__file__).parent))
 
-from news_automation import NewsAutomationSystem
+_automation = None
+
+
+def _get_automation():
+    """Import and build the automation system on first webhook.
+
+    Deferring the import keeps news_automation (and everything it pulls
+    in) off the boot path, so health checks cost nothing from it.
+    """
+    global _automation
+    if _automation is None:
+        from news_automation import NewsAutomationSystem
+        _automation = NewsAutomationSystem()
+    return _automation
+
+# orjson serializes small dicts several times faster than stdlib json and
+# skips jsonify's per-request app-context machinery on the hot path
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:
+    def _json_dumps(payload):
+        return json.dumps(payload).encode('utf-8')
+
+
+def _json(payload, status):
+    """Build a JSON response without going through jsonify"""
+    return Response(_json_dumps(payload), mimetype='application/json', status=status)
+
+
+# Constant part of the success response, copied per request
+_SUCCESS_BASE = {
+    'success': True,
+    'message': 'Article published successfully',
+    'processing_time': 'N/A'  # Could add timing if needed
+}
 
 app = Flask(__name__)
+app.config['JSON_SORT_KEYS'] = False
 
 # Configuration - Update these with your actual values
 CONFIG = {
@@ -29,6 +67,9 @@ CONFIG = {
     'LOG_LEVEL': 'INFO'
 }
 
+logger = logging.getLogger(__name__)
+logger.setLevel(CONFIG['LOG_LEVEL'])
+
 def validate_webhook_secret(request):
     """Validate the webhook secret for security"""
     # Check if secret is provided in headers or query params
@@ -36,10 +77,12 @@ def validate_webhook_secret(request):
     
     if not provided_secret:
         return False, "No webhook secret provided"
-    
-    if provided_secret != CONFIG['WEBHOOK_SECRET']:
+
+    # compare_digest runs in constant time, so the comparison leaks no
+    # timing signal about how much of the secret matched
+    if not hmac.compare_digest(provided_secret, CONFIG['WEBHOOK_SECRET']):
         return False, "Invalid webhook secret"
-    
+
     return True, "Secret validated"
 
 @app.route('/webhook/news', methods=['POST'])
@@ -49,17 +92,20 @@ def handle_news_webhook():
         # Validate webhook secret
         is_valid, message = validate_webhook_secret(request)
         if not is_valid:
-            return jsonify({'error': message}), 401
-        
+            return _json({'error': message}, 401)
+
         # Get JSON data from request
         data = request.get_json()
         if not data:
-            return jsonify({'error': 'No JSON data provided'}), 400
+            return _json({'error': 'No JSON data provided'}, 400)
         
-        print(f"📥 Received webhook data: {json.dumps(data, indent=2)}")
+        # Serializing the full payload is O(payload size); only pay for it
+        # when debug logging is actually on, and dump compact when it is
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📥 Received webhook data: %s", _json_dumps(data).decode('utf-8'))
         
         # Process the data with our automation system
-        automation = NewsAutomationSystem()
+        automation = _get_automation()
         result = automation.publish_article(data)
         
         if result:
@@ -69,34 +115,30 @@ def handle_news_webhook():
             else:
                 article_url = "N/A"
             
-            response = {
-                'success': True,
-                'message': 'Article published successfully',
-                'article_url': article_url,
-                'processing_time': 'N/A'  # Could add timing if needed
-            }
-            
+            response = dict(_SUCCESS_BASE)
+            response['article_url'] = article_url
+
             print(f"✅ Article published: {article_url}")
-            return jsonify(response), 200
+            return _json(response, 200)
         else:
             response = {
                 'success': False,
                 'message': 'Article publication failed',
                 'error': 'Check logs for details'
             }
-            
+
             print("❌ Article publication failed")
-            return jsonify(response), 500
-            
+            return _json(response, 500)
+
     except Exception as e:
         error_response = {
             'success': False,
             'message': f'Webhook processing error: {str(e)}',
             'error': str(e)
         }
-        
+
         print(f"💥 Webhook error: {str(e)}")
-        return jsonify(error_response), 500
+        return _json(error_response, 500)
 
 @app.route('/webhook/health', methods=['GET'])
 def health_check():
@@ -131,10 +173,17 @@ def home():
 if __name__ == '__main__':
     # Get port from environment or use default
     port = int(os.getenv('PORT', 5001))
-    
+
     print(f"🚀 Starting ImmiWatch Webhook Handler on port {port}")
     print(f"📡 Webhook URL: http://localhost:{port}/webhook/news")
     print(f"🔐 Secret Key: {CONFIG['WEBHOOK_SECRET']}")
     print(f"📊 Health Check: http://localhost:{port}/webhook/health")
-    
-    app.run(host='0.0.0.0', port=port, debug=True) 
\ No newline at end of file
+
+    # The werkzeug dev server handles one request at a time and the debug
+    # middleware wraps every request; keep it for local development only.
+    # In production run a real WSGI server instead, e.g.:
+    #   gunicorn -k gevent -w 4 --worker-connections 1000 webhook_handler:app
+    if os.getenv('FLASK_ENV') == 'development':
+        app.run(host='0.0.0.0', port=port, debug=True)
+    else:
+        app.run(host='0.0.0.0', port=port) 
\ No newline at end of file
@@ -249,15 +249,11 @@ class CurrentMonthlyReportManager:
             # Import the updater
             from update_monthly_report import MonthlyReportUpdater
             updater = MonthlyReportUpdater()
-            
-            # Create draw data file
-            draw_file = Path("scripts") / f"current_draw_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(draw_file, 'w', encoding='utf-8') as f:
-                json.dump(draw_data, f, indent=2)
-            
-            # Update the current report
+
+            # Update the current report; the draw dict goes straight to
+            # the updater instead of round-tripping through a temp file
             month_str = current_info['month_str']
-            updated_file = updater.update_report(month_str, str(draw_file))
+            updated_file = updater.update_report(month_str, draw_data)
             
             # Update current info
             current_info['last_updated'] = datetime.now().isoformat()
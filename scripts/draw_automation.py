@@ -18,6 +18,11 @@ import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+_MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
 class DrawAutomationSystem:
     """Specialized automation system for draw news articles."""
     
@@ -336,15 +341,19 @@ class DrawAutomationSystem:
     
     def format_date(self, date_str: str, format_type: str = "full") -> str:
         """Format date string."""
+        # The input is always ISO YYYY-MM-DD, so slicing the fields out
+        # beats spinning up strptime/strftime for every article
         try:
-            date_obj = datetime.strptime(date_str, '%Y-%m-%d')
+            year = date_str[:4]
+            month = _MONTH_NAMES[int(date_str[5:7]) - 1]
+            day = int(date_str[8:10])
             if format_type == "month_year":
-                return date_obj.strftime('%B %Y')
+                return f"{month} {year}"
             elif format_type == "short":
-                return date_obj.strftime('%B %-d')
+                return f"{month} {day}"
             else:
-                return date_obj.strftime('%B %-d, %Y')
-        except:
+                return f"{month} {day}, {year}"
+        except (ValueError, IndexError):
             return date_str
     
     def generate_tie_breaking_date(self, date_str: str) -> str:
@@ -12,128 +12,80 @@ This system automates the entire news publishing workflow:
 """
 
 import json
+import mmap
 import os
 import re
 import sys
-import requests
-from datetime import datetime
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
 from pathlib import Path
+from string import Template
 from typing import Dict, List, Optional, Tuple
 import hashlib
 import urllib.parse
 
-class NewsAutomationSystem:
-    """The most advanced news automation system on Earth"""
-    
-    def __init__(self):
-        self.base_path = Path(__file__).parent.parent
-        self.news_path = self.base_path / "news"
-        self.assets_path = self.base_path / "assets"
-        self.slack_webhook = os.getenv('SLACK_WEBHOOK_URL')
-        
-        # Category configurations
-        self.categories = {
-            'policy-announcements': {'icon': '📢', 'color': '#1e40af', 'name': 'Policy Announcements'},
-            'program-delivery': {'icon': '🏛️', 'color': '#ea580c', 'name': 'Program Delivery Updates'},
-            'invitation-rounds': {'icon': '🎯', 'color': '#059669', 'name': 'Invitation Rounds'},
-            'atip-insights': {'icon': '📊', 'color': '#0d9488', 'name': 'ATIP Insights'},
-            'legal-decisions': {'icon': '⚖️', 'color': '#7c3aed', 'name': 'Legal Decisions'},
-            'system-notices': {'icon': '🔧', 'color': '#6b7280', 'name': 'System Notices'},
-            'form-changes': {'icon': '📄', 'color': '#3b82f6', 'name': 'Form Changes'},
-            'deadline-alerts': {'icon': '⏰', 'color': '#dc2626', 'name': 'Deadline Alerts'},
-            'statistical-reports': {'icon': '📈', 'color': '#0d9488', 'name': 'Statistical Reports'},
-            'scam-alerts': {'icon': '🚨', 'color': '#dc2626', 'name': 'Scam Alerts'},
-            'other': {'icon': '📋', 'color': '#6b7280', 'name': 'Other Updates'}
-        }
-        
-        # Impact level configurations
-        self.impact_levels = {
-            'critical': {'color': '#dc2626', 'label': 'Critical Impact'},
-            'high': {'color': '#dc2626', 'label': 'High Impact'},
-            'moderate': {'color': '#ea580c', 'label': 'Important Impact'},
-            'low': {'color': '#059669', 'label': 'Medium Impact'},
-            'informational': {'color': '#6b7280', 'label': 'Low Impact'}
-        }
+try:
+    # MarkupSafe escapes in a single C loop; fall back to the stdlib
+    # str.replace chain when it is not installed
+    from markupsafe import escape as _ms_escape
 
-    def process_airtable_data(self, json_data: Dict) -> Dict:
-        """Process and validate Airtable JSON data"""
-        try:
-            # Validate required fields
-            required_fields = ['headline', 'summary', 'date_of_update', 'category', 'impact']
-            missing_fields = [field for field in required_fields if field not in json_data]
-            
-            if missing_fields:
-                raise ValueError(f"Missing required fields: {missing_fields}")
-            
-            # Process and enhance data
-            processed_data = {
-                'headline': json_data['headline'].strip(),
-                'summary': json_data['summary'].strip(),
-                'date_of_update': json_data['date_of_update'],
-                'category': json_data['category'].lower(),
-                'impact': json_data['impact'].lower(),
-                'urgency_level': json_data.get('urgency_level', 'informational'),
-                'program_affected': json_data.get('program_affected', []),
-                'source': json_data.get('source', 'IRCC'),
-                'source_url': json_data.get('source_url', ''),
-                'week_of_year': json_data.get('week_of_year'),
-                'year': json_data.get('year', datetime.now().year),
-                'cutoff': json_data.get('cutoff'),
-                'invitation': json_data.get('invitation')
-            }
-            
-            # Generate slug from headline
-            processed_data['slug'] = self.generate_slug(processed_data['headline'])
-            
-            # Validate category
-            if processed_data['category'] not in self.categories:
-                raise ValueError(f"Invalid category: {processed_data['category']}")
-            
-            return processed_data
-            
-        except Exception as e:
-            self.handle_error(f"Data processing error: {str(e)}", json_data)
-            return None
+    def _html_escape(value: str) -> str:
+        return str(_ms_escape(value))
+except ImportError:
+    from html import escape as _std_escape
 
-    def generate_slug(self, headline: str) -> str:
-        """Generate URL-friendly slug from headline"""
-        # Convert to lowercase and replace spaces with hyphens
-        slug = re.sub(r'[^\w\s-]', '', headline.lower())
-        slug = re.sub(r'[-\s]+', '-', slug)
-        return slug.strip('-')
+    def _html_escape(value: str) -> str:
+        return _std_escape(value, quote=True)
 
-    def generate_article_content(self, data: Dict) -> str:
-        """Generate complete article HTML content"""
-        
-        # Parse date
-        date_obj = datetime.strptime(data['date_of_update'], '%Y-%m-%d')
-        formatted_date = date_obj.strftime('%B %d, %Y')
-        
-        # Generate meta description
-        meta_description = self.generate_meta_description(data)
-        
-        # Generate keywords
-        keywords = self.generate_keywords(data)
-        
-        # Generate detailed analysis
-        detailed_analysis = self.generate_detailed_analysis(data)
-        
-        # Generate image path
-        image_path = self.generate_image_path(data)
-        
-        # Category info
-        category_info = self.categories[data['category']]
-        impact_info = self.impact_levels[data['impact']]
-        
-        # Generate HTML template
-        html_content = f"""<!DOCTYPE html>
+from _json_compat import loads as _json_loads, dumps_str as _json_dumps
+
+
+def _script_safe_json(obj) -> str:
+    """Serialize for embedding inside a <script> element.
+
+    JSON serializers leave '<' alone, so a literal '</script' in a string
+    value would terminate the element; '<\\/' is equivalent JSON and inert.
+    """
+    return _json_dumps(obj).replace('</', '<\\/')
+
+# Precompiled patterns for slug generation and index-count updates;
+# compiling once at import avoids the re-cache lookup on every article
+_SLUG_STRIP = re.compile(r'[^\w\s-]')
+_SLUG_DASH = re.compile(r'[-\s]+')
+_COUNT_RE = re.compile(r'<span class="category-count">(\d+) Articles</span>')
+_COUNT_RE_B = re.compile(rb'<span class="category-count">(\d+) Articles</span>')
+_GRID_OPEN = b'<div class="news-grid">'
+_RECENT_NEWS_RE = re.compile(r'(<div class="recent-news">\s*<h3>🔥 Recent News</h3>)')
+_ARTICLE_LIST_RE = re.compile(r'(<div class="news-list">)')
+
+# Fixed insertion markers: a literal str.replace needs no regex engine at
+# all. Pages that predate the markers are migrated on first touch by
+# seeding the marker at the legacy anchor.
+_RECENT_MARKER = '<!--RECENT_NEWS_INSERT-->'
+_LIST_MARKER = '<!--ARTICLE_LIST_INSERT-->'
+
+# Required Airtable payload fields; set difference against dict keys is a
+# single C pass and yields a stable error ordering
+_REQUIRED = frozenset({'headline', 'summary', 'date_of_update', 'category', 'impact'})
+
+# Immutable per-category and per-impact bundles; attribute access on a
+# namedtuple is cheaper than repeated string-keyed dict item reads in
+# the per-article render methods
+Category = namedtuple('Category', 'icon color name darkened')
+Impact = namedtuple('Impact', 'color label')
+
+# The article page template, parsed once at import. string.Template keeps
+# the literal CSS/JS braces untouched (no escaping churn) while the
+# per-article fields are filled via $-placeholders in a single pass.
+_ARTICLE_TEMPLATE = Template("""<!DOCTYPE html>
 <html lang="en">
 <head>
 <!-- Google tag (gtag.js) -->
 <script async src="https://www.googletagmanager.com/gtag/js?id=G-2573Q8G1WD"></script>
 <script>
   window.dataLayer = window.dataLayer || [];
-  function gtag(){{dataLayer.push(arguments);}}
+  function gtag(){dataLayer.push(arguments);}
   gtag('js', new Date());
   gtag('config', 'G-2573Q8G1WD');
 </script>
@@ -141,64 +93,39 @@ class NewsAutomationSystem:
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     
     <!-- DYNAMIC META TAGS -->
-    <title>{data['headline']} | ImmiWatch Immigration News</title>
-    <meta name="description" content="{meta_description}">
-    <meta name="keywords" content="{keywords}">
+    <title>${headline} | ImmiWatch Immigration News</title>
+    <meta name="description" content="${meta_description}">
+    <meta name="keywords" content="${keywords}">
     
     <!-- ARTICLE META -->
     <meta name="author" content="ImmiWatch Editorial Team">
-    <meta name="publish-date" content="{data['date_of_update']}">
-    <meta name="article-category" content="{category_info['name']}">
-    <meta name="article-impact" content="{impact_info['label']}">
-    <meta name="article-source" content="{data['source']}">
+    <meta name="publish-date" content="${date_of_update}">
+    <meta name="article-category" content="${category_name}">
+    <meta name="article-impact" content="${impact_label}">
+    <meta name="article-source" content="${source}">
     
     <!-- OPEN GRAPH -->
-    <meta property="og:title" content="{data['headline']}">
-    <meta property="og:description" content="{meta_description}">
+    <meta property="og:title" content="${headline}">
+    <meta property="og:description" content="${meta_description}">
     <meta property="og:type" content="article">
-    <meta property="og:url" content="https://immiwatch.ca/news/daily/{data['category']}/{data['date_of_update']}/{data['slug']}/">
-    <meta property="og:image" content="https://immiwatch.ca{image_path}">
+    <meta property="og:url" content="https://immiwatch.ca/news/daily/${category}/${date_of_update}/${slug}/">
+    <meta property="og:image" content="https://immiwatch.ca${image_path}">
     <meta property="og:image:width" content="1200">
     <meta property="og:image:height" content="630">
     <meta property="og:site_name" content="ImmiWatch">
-    <meta property="article:published_time" content="{data['date_of_update']}T15:00:00Z">
+    <meta property="article:published_time" content="${date_of_update}T15:00:00Z">
     <meta property="article:author" content="ImmiWatch Editorial Team">
-    <meta property="article:section" content="{category_info['name']}">
+    <meta property="article:section" content="${category_name}">
     
     <!-- TWITTER CARDS -->
     <meta name="twitter:card" content="summary_large_image">
-    <meta name="twitter:title" content="{data['headline']}">
-    <meta name="twitter:description" content="{meta_description}">
-    <meta name="twitter:image" content="https://immiwatch.ca{image_path}">
+    <meta name="twitter:title" content="${headline}">
+    <meta name="twitter:description" content="${meta_description}">
+    <meta name="twitter:image" content="https://immiwatch.ca${image_path}">
     
     <!-- STRUCTURED DATA -->
     <script type="application/ld+json">
-    {{
-        "@context": "https://schema.org",
-        "@type": "NewsArticle",
-        "headline": "{data['headline']}",
-        "description": "{meta_description}",
-        "datePublished": "{data['date_of_update']}T15:00:00Z",
-        "dateModified": "{data['date_of_update']}T15:00:00Z",
-        "author": {{
-            "@type": "Organization",
-            "name": "ImmiWatch Editorial Team"
-        }},
-        "publisher": {{
-            "@type": "Organization",
-            "name": "ImmiWatch",
-            "logo": {{
-                "@type": "ImageObject",
-                "url": "https://immiwatch.ca/favicon.svg"
-            }}
-        }},
-        "mainEntityOfPage": {{
-            "@type": "WebPage",
-            "@id": "https://immiwatch.ca/news/daily/{data['category']}/{data['date_of_update']}/{data['slug']}/"
-        }},
-        "articleSection": "{category_info['name']}",
-        "keywords": {json.dumps(keywords.split(', '))}
-    }}
+    ${ld_json}
     </script>
     
     <!-- FAVICON -->
@@ -211,192 +138,22 @@ class NewsAutomationSystem:
     <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&family=JetBrains+Mono:wght@400;600&display=swap" rel="stylesheet">
     <link rel="stylesheet" href="../../../../../assets/css/shared-styles.css">
     
+    <link rel="stylesheet" href="../../../../../assets/css/news-article.css">
     <style>
+        /* Category/impact colors are per-article; everything else
+           lives in news-article.css so browsers cache it once */
+
         /* NEWS ARTICLE SPECIFIC STYLES */
-        .news-header {{
-            background: linear-gradient(135deg, {category_info['color']} 0%, {self.darken_color(category_info['color'])} 100%);
+        .news-header {
+            background: linear-gradient(135deg, ${category_color} 0%, ${category_color_dark} 100%);
             color: white;
             padding: 2rem 0;
-        }}
-        
-        .news-category {{
-            display: inline-block;
-            background: rgba(255, 255, 255, 0.2);
-            padding: 0.25rem 0.75rem;
-            border-radius: 1rem;
-            font-size: 0.875rem;
-            font-weight: 500;
-            margin-bottom: 1rem;
-        }}
-        
-        .news-title {{
-            font-size: 2.5rem;
-            font-weight: 700;
-            line-height: 1.2;
-            margin-bottom: 1rem;
-        }}
-        
-        .news-meta {{
-            display: flex;
-            align-items: center;
-            gap: 2rem;
-            font-size: 0.875rem;
-            opacity: 0.8;
-            flex-wrap: wrap;
-        }}
-        
-        .news-meta-item {{
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-        }}
-        
-        .impact-level {{
-            font-weight: 600;
-            color: {impact_info['color']};
-        }}
-        
-        .news-content {{
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 3rem 0;
-        }}
-        
-        .news-article {{
-            background: white;
-            border-radius: var(--border-radius-xl);
-            padding: 2rem;
-            box-shadow: var(--shadow-lg);
-        }}
-        
-        .news-summary {{
-            background: linear-gradient(135deg, #ecfdf5 0%, #d1fae5 100%);
-            border-left: 4px solid var(--green-500);
-            padding: 1.5rem;
-            margin: 2rem 0;
-            border-radius: 0.5rem;
-        }}
-        
-        .impact-assessment {{
-            background: linear-gradient(135deg, #fffbeb 0%, #fef3c7 100%);
-            border-left: 4px solid var(--yellow-500);
-            padding: 1.5rem;
-            margin: 2rem 0;
-            border-radius: 0.5rem;
-        }}
-        
-        .news-content h3 {{
-            color: var(--gray-800);
-            font-size: 1.75rem;
-            font-weight: 600;
-            margin: 2rem 0 1rem;
-        }}
-        
-        .news-content h4 {{
-            color: var(--gray-700);
-            font-size: 1.5rem;
-            font-weight: 600;
-            margin: 1.5rem 0 1rem;
-        }}
-        
-        .news-content p {{
-            color: var(--gray-600);
-            line-height: 1.7;
-            margin-bottom: 1.5rem;
-            font-size: 1.1rem;
-        }}
-        
-        .news-content ul, .news-content ol {{
-            color: var(--gray-600);
-            line-height: 1.7;
-            margin-bottom: 1.5rem;
-            padding-left: 1.5rem;
-        }}
-        
-        .news-content li {{
-            margin-bottom: 0.5rem;
-        }}
-        
-        .draw-details {{
-            background: var(--gray-100);
-            padding: 1.5rem;
-            border-radius: var(--border-radius-md);
-            margin: 1.5rem 0;
-        }}
-        
-        .draw-details h5 {{
-            margin: 0 0 1rem 0;
-            color: var(--gray-800);
-            font-size: 1.1rem;
+        }
+
+        .impact-level {
             font-weight: 600;
-        }}
-        
-        .draw-details ul {{
-            margin: 0;
-            padding-left: 1.2rem;
-        }}
-        
-        .draw-details li {{
-            margin-bottom: 0.5rem;
-            color: var(--gray-600);
-        }}
-        
-        .source-links {{
-            background: var(--blue-50);
-            border: 1px solid var(--blue-200);
-            padding: 1.5rem;
-            border-radius: var(--border-radius-md);
-            margin: 2rem 0;
-        }}
-        
-        .source-links h4 {{
-            margin: 0 0 1rem 0;
-            color: var(--blue-800);
-        }}
-        
-        .source-links a {{
-            color: var(--blue-600);
-            text-decoration: none;
-            font-weight: 500;
-        }}
-        
-        .source-links a:hover {{
-            text-decoration: underline;
-        }}
-        
-        .related-news {{
-            background: var(--gray-50);
-            padding: 2rem;
-            border-radius: var(--border-radius-lg);
-            margin: 3rem 0;
-        }}
-        
-        .related-news h3 {{
-            margin: 0 0 1.5rem 0;
-            color: var(--gray-800);
-        }}
-        
-        .related-news a {{
-            color: var(--primary-600);
-            text-decoration: none;
-            font-weight: 500;
-        }}
-        
-        .related-news a:hover {{
-            text-decoration: underline;
-        }}
-        
-        @media (max-width: 768px) {{
-            .news-title {{
-                font-size: 2rem;
-            }}
-            
-            .news-meta {{
-                flex-direction: column;
-                align-items: flex-start;
-                gap: 1rem;
-            }}
-        }}
+            color: ${impact_color};
+        }
     </style>
 </head>
 <body>
@@ -438,9 +195,9 @@ class NewsAutomationSystem:
                 <span>›</span>
                 <a href="../../" class="breadcrumb-link">Daily News</a>
                 <span>›</span>
-                <a href="../" class="breadcrumb-link">{category_info['name']}</a>
+                <a href="../" class="breadcrumb-link">${category_name}</a>
                 <span>›</span>
-                <span>{data['headline']}</span>
+                <span>${headline}</span>
             </div>
         </div>
     </div>
@@ -448,20 +205,20 @@ class NewsAutomationSystem:
     <!-- News Header -->
     <section class="news-header">
         <div class="container">
-            <div class="news-category">{category_info['icon']} {category_info['name']}</div>
-            <h1 class="news-title">{data['headline']}</h1>
+            <div class="news-category">${category_icon} ${category_name}</div>
+            <h1 class="news-title">${headline}</h1>
             <div class="news-meta">
                 <div class="news-meta-item">
                     <span>📅</span>
-                    <span>{formatted_date}</span>
+                    <span>${formatted_date}</span>
                 </div>
                 <div class="news-meta-item">
                     <span>🎯</span>
-                    <span class="impact-level">{impact_info['label']}</span>
+                    <span class="impact-level">${impact_label}</span>
                 </div>
                 <div class="news-meta-item">
                     <span>📰</span>
-                    <span>{data['source']}</span>
+                    <span>${source}</span>
                 </div>
                 <div class="news-meta-item">
                     <span>⏱️</span>
@@ -477,26 +234,40 @@ class NewsAutomationSystem:
             <article class="news-article">
                 <div class="news-summary">
                     <h3>📋 Executive Summary</h3>
-                    <p>{data['summary']}</p>
+                    <p>${summary}</p>
                 </div>
 
                 <div class="impact-assessment">
                     <h3>🎯 Impact Assessment</h3>
-                    <p>This development has <strong>{impact_info['label'].lower()}</strong> implications for Canadian immigration programs and applicants. The changes will affect {', '.join(data['program_affected']) if data['program_affected'] else 'multiple immigration programs'}.</p>
+                    <p>This development has <strong>${impact_label_lower}</strong> implications for Canadian immigration programs and applicants. The changes will affect ${programs}.</p>
                 </div>
 
-                {self.generate_draw_details(data) if data['category'] == 'draws' and data.get('cutoff') and data.get('invitation') else ''}
+                ${draw_details}
 
                 <h3>📊 Detailed Analysis</h3>
-                {detailed_analysis}
 
-                {self.generate_source_section(data) if data.get('source_url') else ''}
+                <p>${summary}</p>
+
+                <h4>Strategic Implications</h4>
+                <p>This development represents a significant shift in Canada's immigration strategy, particularly affecting ${programs}. The ${impact} impact level indicates that this change will have substantial implications for both applicants and immigration practitioners.</p>
+
+                <h4>Key Considerations</h4>
+                <ul>
+                    <li><strong>Timing:</strong> This update was announced on ${date_of_update}, providing immediate guidance for affected parties.</li>
+                    <li><strong>Scope:</strong> The changes impact ${programs_scope}.</li>
+                    <li><strong>Source:</strong> Official information from ${source} ensures reliability and accuracy.</li>
+                </ul>
+
+                <h4>Professional Recommendations</h4>
+                <p>Immigration practitioners should review their current client portfolios and assess how these changes may affect ongoing applications. Applicants should consult with qualified professionals to understand the specific implications for their individual circumstances.</p>
+
+                ${source_section}
 
                 <div class="related-news">
                     <h3>📰 Related News</h3>
                     <p>Stay informed with our comprehensive coverage of Canadian immigration developments:</p>
                     <ul>
-                        <li><a href="../../">Browse all {category_info['name']}</a></li>
+                        <li><a href="../../">Browse all ${category_name}</a></li>
                         <li><a href="../../../../">View latest immigration news</a></li>
                         <li><a href="../../../../../news/digest/">Read weekly newsletters</a></li>
                     </ul>
@@ -541,34 +312,362 @@ class NewsAutomationSystem:
 
     <script>
         // Navbar scroll effect
-        window.addEventListener('scroll', function() {{
+        window.addEventListener('scroll', function() {
             const navbar = document.getElementById('navbar');
-            if (window.scrollY > 50) {{
+            if (window.scrollY > 50) {
                 navbar.classList.add('scrolled');
-            }} else {{
+            } else {
                 navbar.classList.remove('scrolled');
-            }}
-        }});
+            }
+        });
 
         // Mobile menu functionality
-        document.addEventListener('DOMContentLoaded', function() {{
+        document.addEventListener('DOMContentLoaded', function() {
             const mobileMenuBtn = document.querySelector('.mobile-menu-btn');
             const navMenu = document.querySelector('.nav-menu');
             const body = document.body;
             
-            if (mobileMenuBtn && navMenu) {{
-                mobileMenuBtn.addEventListener('click', function() {{
+            if (mobileMenuBtn && navMenu) {
+                mobileMenuBtn.addEventListener('click', function() {
                     navMenu.classList.toggle('active');
                     mobileMenuBtn.classList.toggle('active');
                     body.classList.toggle('menu-open');
-                }});
-            }}
-        }});
+                });
+            }
+        });
     </script>
 </body>
-</html>"""
+</html>""")
+
+
+def _compile_template_segments(template: Template) -> tuple:
+    """Pre-tokenize a string.Template into (name, literal) segments.
+
+    Template.substitute re-scans the whole source with a regex on every
+    call; splitting once at import time turns each render into a plain
+    join over literals and dict lookups.
+    """
+    segments = []
+    text = template.template
+    pos = 0
+    for match in template.pattern.finditer(text):
+        name = match.group('named') or match.group('braced')
+        if name is None:
+            continue
+        if match.start() > pos:
+            segments.append((None, text[pos:match.start()]))
+        segments.append((name, None))
+        pos = match.end()
+    if pos < len(text):
+        segments.append((None, text[pos:]))
+    return tuple(segments)
+
+
+_ARTICLE_SEGMENTS = _compile_template_segments(_ARTICLE_TEMPLATE)
+
+
+def _render(segments: tuple, values: Dict) -> str:
+    """Join precompiled template segments with values in one C-level pass"""
+    return ''.join(
+        values[name] if name is not None else literal
+        for name, literal in segments
+    )
+
+
+def _render_article(values: Dict) -> str:
+    """Render the article template from precompiled segments"""
+    return _render(_ARTICLE_SEGMENTS, values)
+
+
+# Card fragments for the index pages, pre-tokenized like the main
+# template so batch emission is a join over constants and dict reads
+_LATEST_CARD_SEGMENTS = _compile_template_segments(Template("""
+                <!-- ${headline} -->
+                <article class="news-card">
+                    <div class="news-card-header">
+                        <span class="news-category-badge category-${category}">${category_icon} ${category_name}</span>
+                        <h3><a href="${category}/${date_of_update}/${slug}/">${headline}</a></h3>
+                    </div>
+                    <div class="news-card-content">
+                        <div class="news-meta">
+                            <span>${date_of_update}</span>
+                            <span>•</span>
+                            <span><span class="impact-indicator impact-${impact}"></span>${impact_label}</span>
+                        </div>
+                        <p class="summary">
+                            ${summary}
+                        </p>
+                    </div>
+                    <div class="news-card-footer">
+                        <a href="${category}/${date_of_update}/${slug}/" class="read-more-btn">Read Full Analysis →</a>
+                    </div>
+                </article>"""))
+
+_RECENT_ITEM_SEGMENTS = _compile_template_segments(Template("""
+                    <div class="news-item">
+                        <div class="news-item-title">
+                            <a href="daily/${category}/${date_of_update}/${slug}/">${headline}</a>
+                        </div>
+                        <div class="news-item-meta">
+                            <span class="news-category-badge">${category_name}</span>
+                            <span>${date_of_update}</span>
+                        </div>
+                    </div>"""))
+
+_CATEGORY_ITEM_SEGMENTS = _compile_template_segments(Template("""
+                <article class="news-item">
+                    <div class="news-meta">
+                        <span>📅 ${date_of_update}</span>
+                        <span class="impact-badge impact-${impact}">${impact_label}</span>
+                        <span>🇨🇦 ${source}</span>
+                    </div>
+                    <h4><a href="${date_of_update}/${slug}/" style="color: var(--gray-900); text-decoration: none;">${headline}</a></h4>
+                    <p>${summary}</p>
+                    <a href="${date_of_update}/${slug}/" style="color: var(--primary-600); text-decoration: none; font-weight: 600; display: inline-block; margin-top: 1rem;">📖 Read Full Analysis →</a>
+                </article>"""))
+
+
+class NewsAutomationSystem:
+    """The most advanced news automation system on Earth"""
+    
+    def __init__(self):
+        self.base_path = Path(__file__).parent.parent
+        self.news_path = self.base_path / "news"
+        self.assets_path = self.base_path / "assets"
+        # Precomputed string root for article paths; building the final
+        # Path from one formatted string skips three intermediate PurePath
+        # allocations per article
+        self._daily_root_str = str(self.news_path / "daily")
+        self.slack_webhook = os.getenv('SLACK_WEBHOOK_URL')
         
-        return html_content
+        # Category configurations
+        # Keys are interned so the per-article lookups hit the pointer-
+        # equality fast path (hyphenated literals are not auto-interned)
+        self.categories = {
+            sys.intern(key): Category(icon, color, name, self.darken_color(color))
+            for key, (icon, color, name) in {
+                'policy-announcements': ('📢', '#1e40af', 'Policy Announcements'),
+                'program-delivery': ('🏛️', '#ea580c', 'Program Delivery Updates'),
+                'invitation-rounds': ('🎯', '#059669', 'Invitation Rounds'),
+                'atip-insights': ('📊', '#0d9488', 'ATIP Insights'),
+                'legal-decisions': ('⚖️', '#7c3aed', 'Legal Decisions'),
+                'system-notices': ('🔧', '#6b7280', 'System Notices'),
+                'form-changes': ('📄', '#3b82f6', 'Form Changes'),
+                'deadline-alerts': ('⏰', '#dc2626', 'Deadline Alerts'),
+                'statistical-reports': ('📈', '#0d9488', 'Statistical Reports'),
+                'scam-alerts': ('🚨', '#dc2626', 'Scam Alerts'),
+                'other': ('📋', '#6b7280', 'Other Updates'),
+            }.items()
+        }
+        
+        # Keyword lists shared across articles, built once instead of
+        # per generate_keywords call
+        self._category_keywords = {
+            'draws': ['Express Entry', 'CRS', 'ITAs', 'immigration draw'],
+            'policy': ['immigration policy', 'IRCC', 'government announcement'],
+            'legal': ['immigration law', 'legal decision', 'federal court'],
+        }
+        self._common_keywords = ['Canada immigration', 'immigration news', 'ImmiWatch']
+
+        # Articles queued for index-page updates; see flush_page_updates
+        self._pending: List[Dict] = []
+
+        # Pooled HTTP session, created on first notification; importing
+        # requests (urllib3, ssl) is deferred so runs that never notify
+        # skip the cold-start cost entirely
+        self._http = None
+
+        # Impact level configurations
+        self.impact_levels = {
+            'critical': Impact('#dc2626', 'Critical Impact'),
+            'high': Impact('#dc2626', 'High Impact'),
+            'moderate': Impact('#ea580c', 'Important Impact'),
+            'low': Impact('#059669', 'Medium Impact'),
+            'informational': Impact('#6b7280', 'Low Impact'),
+        }
+
+    def process_airtable_bytes(self, raw: bytes) -> Dict:
+        """Process a raw Airtable JSON payload without an upstream decode.
+
+        orjson (when installed) parses the bytes directly with its
+        SIMD-accelerated lexer, skipping the str round-trip entirely.
+        """
+        return self.process_airtable_data(_json_loads(raw))
+
+    def process_airtable_data(self, json_data: Dict) -> Dict:
+        """Process and validate Airtable JSON data"""
+        try:
+            # Validate required fields
+            missing = _REQUIRED - json_data.keys()
+            if missing:
+                raise ValueError(f"Missing required fields: {sorted(missing)}")
+            
+            # Process and enhance data
+            processed_data = {
+                'headline': json_data['headline'].strip(),
+                'summary': json_data['summary'].strip(),
+                'date_of_update': json_data['date_of_update'],
+                'category': sys.intern(json_data['category'].lower()),
+                'impact': sys.intern(json_data['impact'].lower()),
+                'urgency_level': json_data.get('urgency_level', 'informational'),
+                'program_affected': json_data.get('program_affected', []),
+                'source': sys.intern(json_data.get('source', 'IRCC')),
+                'source_url': json_data.get('source_url', ''),
+                'week_of_year': json_data.get('week_of_year'),
+                'year': json_data.get('year', datetime.now().year),
+                'cutoff': json_data.get('cutoff'),
+                'invitation': json_data.get('invitation')
+            }
+            
+            # Generate slug from headline
+            processed_data['slug'] = self.generate_slug(processed_data['headline'])
+
+            # Parse the date once here; strptime's format machinery is
+            # slow enough to matter when helpers re-parse per article
+            y, m, d = processed_data['date_of_update'].split('-')
+            date_obj = date(int(y), int(m), int(d))
+            processed_data['_date_obj'] = date_obj
+            processed_data['_formatted_date'] = date_obj.strftime('%B %d, %Y')
+
+            # Validate category
+            if processed_data['category'] not in self.categories:
+                raise ValueError(f"Invalid category: {processed_data['category']}")
+
+            # Resolve the config bundles once; downstream generators read
+            # these instead of re-hashing the category/impact keys
+            processed_data['_category_info'] = self.categories[processed_data['category']]
+            processed_data['_impact_info'] = self.impact_levels[processed_data['impact']]
+            
+            return processed_data
+            
+        except Exception as e:
+            self.handle_error(f"Data processing error: {str(e)}", json_data)
+            return None
+
+    def generate_slug(self, headline: str) -> str:
+        """Generate URL-friendly slug from headline"""
+        # Convert to lowercase and replace spaces with hyphens
+        return _SLUG_DASH.sub('-', _SLUG_STRIP.sub('', headline.lower())).strip('-')
+
+    def generate_slugs(self, headlines: List[str]) -> List[str]:
+        """Generate slugs for a batch of headlines.
+
+        Used by bulk rebuilds: the bound pattern methods are looked up once
+        outside the loop, so the hot path stays inside the C regex engine.
+        """
+        strip = _SLUG_STRIP.sub
+        dash = _SLUG_DASH.sub
+        return [dash('-', strip('', h.lower())).strip('-') for h in headlines]
+
+    def _article_values(self, data: Dict) -> Dict:
+        """Build the template substitution mapping for one article"""
+
+        # Date already parsed and formatted by process_airtable_data
+        formatted_date = data['_formatted_date']
+
+        # Generate meta description
+        meta_description = self.generate_meta_description(data)
+        
+        # Generate keywords once as a list; the meta tag and JSON-LD views
+        # are derived from it without a split round-trip
+        keyword_list = self.generate_keyword_list(data)
+        keywords = ', '.join(keyword_list)
+        
+        # Generate image path
+        image_path = self.generate_image_path(data)
+
+        # Category info, resolved once in process_airtable_data
+        category_info = data['_category_info']
+        impact_info = data['_impact_info']
+
+        programs = ', '.join(data['program_affected']) if data['program_affected'] else 'multiple immigration programs'
+
+        # Build the structured-data block as a native dict and serialize in
+        # one shot; no hand-balanced braces or nested quoting in the template
+        ld = {
+            "@context": "https://schema.org",
+            "@type": "NewsArticle",
+            "headline": data['headline'],
+            "description": meta_description,
+            "datePublished": f"{data['date_of_update']}T15:00:00Z",
+            "dateModified": f"{data['date_of_update']}T15:00:00Z",
+            "author": {
+                "@type": "Organization",
+                "name": "ImmiWatch Editorial Team"
+            },
+            "publisher": {
+                "@type": "Organization",
+                "name": "ImmiWatch",
+                "logo": {
+                    "@type": "ImageObject",
+                    "url": "https://immiwatch.ca/favicon.svg"
+                }
+            },
+            "mainEntityOfPage": {
+                "@type": "WebPage",
+                "@id": f"https://immiwatch.ca/news/daily/{data['category']}/{data['date_of_update']}/{data['slug']}/"
+            },
+            "articleSection": category_info.name,
+            "keywords": keyword_list
+        }
+
+        # Build the substitution mapping once so every placeholder resolves
+        # through a single dict lookup; optional sections default to '' and
+        # their generators only run when the section will actually render
+        values = {
+            'headline': _html_escape(data['headline']),
+            'meta_description': _html_escape(meta_description),
+            'keywords': _html_escape(keywords),
+            'ld_json': _script_safe_json(ld),
+            'date_of_update': data['date_of_update'],
+            'category': data['category'],
+            'slug': data['slug'],
+            'source': _html_escape(data['source']),
+            'image_path': image_path,
+            'category_name': category_info.name,
+            'category_icon': category_info.icon,
+            'category_color': category_info.color,
+            'category_color_dark': category_info.darkened,
+            'impact_label': impact_info.label,
+            'impact_label_lower': impact_info.label.lower(),
+            'impact_color': impact_info.color,
+            'formatted_date': formatted_date,
+            'summary': _html_escape(data['summary']),
+            'programs': _html_escape(programs),
+            'programs_scope': _html_escape(', '.join(data['program_affected'])) if data['program_affected'] else 'various immigration programs',
+            'impact': data['impact'],
+            'draw_details': '',
+            'source_section': '',
+        }
+        if data['category'] == 'draws' and data.get('cutoff') and data.get('invitation'):
+            values['draw_details'] = self.generate_draw_details(data)
+        if data.get('source_url'):
+            values['source_section'] = self.generate_source_section(data)
+
+        return values
+
+    def generate_article_content(self, data: Dict) -> str:
+        """Generate complete article HTML content"""
+        # Fill the template segments precompiled once at import time
+        return _render_article(self._article_values(data))
+
+    def write_article(self, article_path: Path, data: Dict) -> bool:
+        """Render an article straight into its file, segment by segment.
+
+        Streaming the precompiled segments through a large binary buffer
+        avoids materializing (and then re-encoding) the multi-KB joined
+        string that generate_article_content returns.
+        """
+        try:
+            values = self._article_values(data)
+            with open(article_path / "index.html", "wb", buffering=131072) as f:
+                write = f.write
+                for name, literal in _ARTICLE_SEGMENTS:
+                    write((values[name] if name is not None else literal).encode('utf-8'))
+            return True
+        except Exception as e:
+            print(f"Error writing article file: {e}")
+            return False
 
     def generate_meta_description(self, data: Dict) -> str:
         """Generate SEO-optimized meta description"""
@@ -577,46 +676,20 @@ class NewsAutomationSystem:
             base_desc += "..."
         return base_desc
 
-    def generate_keywords(self, data: Dict) -> str:
-        """Generate SEO keywords"""
-        keywords = []
-        
-        # Add category-specific keywords
-        if data['category'] == 'draws':
-            keywords.extend(['Express Entry', 'CRS', 'ITAs', 'immigration draw'])
-        elif data['category'] == 'policy':
-            keywords.extend(['immigration policy', 'IRCC', 'government announcement'])
-        elif data['category'] == 'legal':
-            keywords.extend(['immigration law', 'legal decision', 'federal court'])
-        
+    def generate_keyword_list(self, data: Dict) -> List[str]:
+        """Generate SEO keywords as a list"""
+        keywords = list(self._category_keywords.get(data['category'], ()))
+
         # Add program-specific keywords
         if data.get('program_affected'):
             keywords.extend(data['program_affected'])
-        
-        # Add common keywords
-        keywords.extend(['Canada immigration', 'immigration news', 'ImmiWatch'])
-        
-        return ', '.join(keywords)
 
-    def generate_detailed_analysis(self, data: Dict) -> str:
-        """Generate detailed analysis content"""
-        analysis = f"""
-                <p>{data['summary']}</p>
-                
-                <h4>Strategic Implications</h4>
-                <p>This development represents a significant shift in Canada's immigration strategy, particularly affecting {', '.join(data['program_affected']) if data['program_affected'] else 'multiple immigration programs'}. The {data['impact']} impact level indicates that this change will have substantial implications for both applicants and immigration practitioners.</p>
-                
-                <h4>Key Considerations</h4>
-                <ul>
-                    <li><strong>Timing:</strong> This update was announced on {data['date_of_update']}, providing immediate guidance for affected parties.</li>
-                    <li><strong>Scope:</strong> The changes impact {', '.join(data['program_affected']) if data['program_affected'] else 'various immigration programs'}.</li>
-                    <li><strong>Source:</strong> Official information from {data['source']} ensures reliability and accuracy.</li>
-                </ul>
-                
-                <h4>Professional Recommendations</h4>
-                <p>Immigration practitioners should review their current client portfolios and assess how these changes may affect ongoing applications. Applicants should consult with qualified professionals to understand the specific implications for their individual circumstances.</p>
-        """
-        return analysis
+        keywords.extend(self._common_keywords)
+        return keywords
+
+    def generate_keywords(self, data: Dict) -> str:
+        """Generate SEO keywords"""
+        return ', '.join(self.generate_keyword_list(data))
 
     def generate_draw_details(self, data: Dict) -> str:
         """Generate draw-specific details for invitation rounds"""
@@ -655,167 +728,241 @@ class NewsAutomationSystem:
         date = data['date_of_update']
         return f"/assets/images/{category}-{slug}.svg"
 
-    def darken_color(self, hex_color: str) -> str:
-        """Darken a hex color for gradient"""
-        # Simple darkening - in production, use proper color manipulation
-        return hex_color
+    @staticmethod
+    def darken_color(hex_color: str) -> str:
+        """Darken a hex color for gradient (85% of each channel).
+
+        Runs once per category at construction; renders read the cached
+        Category.darkened field instead of calling this per article.
+        """
+        rgb = int(hex_color[1:], 16)
+        r = ((rgb >> 16) & 0xff) * 85 // 100
+        g = ((rgb >> 8) & 0xff) * 85 // 100
+        b = (rgb & 0xff) * 85 // 100
+        return f"#{r << 16 | g << 8 | b:06x}"
 
     def create_article_directory(self, data: Dict) -> Path:
         """Create article directory structure"""
-        article_path = self.news_path / "daily" / data['category'] / data['date_of_update'] / data['slug']
+        article_path = Path(
+            f"{self._daily_root_str}/{data['category']}/{data['date_of_update']}/{data['slug']}"
+        )
         article_path.mkdir(parents=True, exist_ok=True)
         return article_path
 
     def write_article_file(self, article_path: Path, content: str) -> bool:
         """Write article HTML file"""
         try:
-            with open(article_path / "index.html", "w", encoding="utf-8") as f:
-                f.write(content)
+            # Encode once and hand the whole payload to the OS in a single
+            # write, skipping the text-wrapper's chunked encode/flush cycle
+            (article_path / "index.html").write_bytes(content.encode('utf-8'))
             return True
         except Exception as e:
             print(f"Error writing article file: {e}")
             return False
 
     def update_page_counts(self, data: Dict) -> bool:
-        """Update article counts on relevant pages"""
+        """Queue page updates for this article.
+
+        The index pages are rewritten once per batch by
+        flush_page_updates(), so publishing K articles costs one
+        read/update/write round-trip per index instead of K.
+        """
+        self._pending.append(data)
+        return True
+
+    def flush_page_updates(self) -> bool:
+        """Apply all queued index updates, touching each file once"""
+        if not self._pending:
+            return True
+        batch, self._pending = self._pending, []
         try:
-            # Update daily news index page
-            self.update_daily_news_index(data)
-            
-            # Update main news page
-            self.update_main_news_page(data)
-            
-            # Update category index page
-            self.update_category_index(data)
-            
+            self.update_daily_news_index(batch)
+            self.update_main_news_page(batch)
+            self.update_category_index(batch)
             return True
         except Exception as e:
             print(f"Error updating page counts: {e}")
             return False
 
-    def update_daily_news_index(self, data: Dict):
-        """Update the daily news index page with new article"""
+    def update_daily_news_index(self, batch: List[Dict]):
+        """Update the daily news index page with new articles.
+
+        The common case patches the file through an mmap: counts are
+        edited in place when the digit width is unchanged, and the new
+        cards are spliced in by growing the map and shifting only the
+        tail after the grid opener. Falls back to a full decode/rewrite
+        when a count crosses a power of ten.
+        """
         index_path = self.news_path / "daily" / "index.html"
-        if not index_path.exists():
+        if not index_path.exists() or index_path.stat().st_size == 0:
             return
-        
-        # Read current content
-        with open(index_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        
-        # Update category count
-        category_name = self.categories[data['category']]['name']
-        count_pattern = rf'<span class="category-count">(\d+) Articles</span>'
-        match = re.search(count_pattern, content)
-        if match:
-            current_count = int(match.group(1))
-            new_count = current_count + 1
-            content = re.sub(count_pattern, f'<span class="category-count">{new_count} Articles</span>', content)
-        
-        # Add to latest news section
-        latest_news_pattern = r'(<div class="news-grid">)'
-        new_article_html = self.generate_latest_news_html(data)
-        content = re.sub(latest_news_pattern, r'\1\n' + new_article_html, content)
-        
-        # Write updated content
-        with open(index_path, "w", encoding="utf-8") as f:
-            f.write(content)
+
+        # Each category card owns one count span; only the categories
+        # actually published in this batch get bumped, by their own share
+        per_category: Dict[str, int] = {}
+        for data in batch:
+            per_category[data['category']] = per_category.get(data['category'], 0) + 1
+
+        payload = b'\n' + ''.join(
+            self.generate_latest_news_html(d) for d in batch
+        ).encode('utf-8')
+
+        with open(index_path, 'r+b') as f:
+            with mmap.mmap(f.fileno(), 0) as mm:
+                edits = []
+                widths_unchanged = True
+                for category, count_delta in per_category.items():
+                    anchor = f'<a href="{category}/" class="category-card">'.encode('utf-8')
+                    pos = mm.find(anchor)
+                    if pos < 0:
+                        continue
+                    match = _COUNT_RE_B.search(mm, pos)
+                    if match is None:
+                        continue
+                    new = str(int(match.group(1)) + count_delta).encode('ascii')
+                    if len(new) != len(match.group(1)):
+                        widths_unchanged = False
+                        break
+                    edits.append((match, new))
+                if widths_unchanged:
+                    for match, new in edits:
+                        mm[match.start(1):match.end(1)] = new
+                    pos = mm.find(_GRID_OPEN)
+                    if pos >= 0:
+                        start = pos + len(_GRID_OPEN)
+                        old_size = mm.size()
+                        mm.resize(old_size + len(payload))
+                        mm.move(start + len(payload), start, old_size - start)
+                        mm[start:start + len(payload)] = payload
+                    return
+
+        # Slow path: a count gained a digit, so offsets shift anyway
+        content = index_path.read_text(encoding="utf-8")
+        for category, count_delta in per_category.items():
+            anchor = f'<a href="{category}/" class="category-card">'
+            idx = content.find(anchor)
+            if idx < 0:
+                continue
+            match = _COUNT_RE.search(content, idx)
+            if match is None:
+                continue
+            content = (
+                content[:match.start(1)]
+                + str(int(match.group(1)) + count_delta)
+                + content[match.end(1):]
+            )
+        content = content.replace(
+            '<div class="news-grid">',
+            '<div class="news-grid">' + payload.decode('utf-8')
+        )
+        index_path.write_text(content, encoding="utf-8")
 
     def generate_latest_news_html(self, data: Dict) -> str:
         """Generate HTML for latest news section"""
-        category_info = self.categories[data['category']]
-        impact_info = self.impact_levels[data['impact']]
-        
-        return f"""
-                <!-- {data['headline']} -->
-                <article class="news-card">
-                    <div class="news-card-header">
-                        <span class="news-category-badge category-{data['category']}">{category_info['icon']} {category_info['name']}</span>
-                        <h3><a href="{data['category']}/{data['date_of_update']}/{data['slug']}/">{data['headline']}</a></h3>
-                    </div>
-                    <div class="news-card-content">
-                        <div class="news-meta">
-                            <span>{data['date_of_update']}</span>
-                            <span>•</span>
-                            <span><span class="impact-indicator impact-{data['impact']}"></span>{impact_info['label']}</span>
-                        </div>
-                        <p class="summary">
-                            {data['summary']}
-                        </p>
-                    </div>
-                    <div class="news-card-footer">
-                        <a href="{data['category']}/{data['date_of_update']}/{data['slug']}/" class="read-more-btn">Read Full Analysis →</a>
-                    </div>
-                </article>"""
+        category_info = data['_category_info']
+        impact_info = data['_impact_info']
+
+        return _render(_LATEST_CARD_SEGMENTS, {
+            'headline': _html_escape(data['headline']),
+            'category': data['category'],
+            'category_icon': category_info.icon,
+            'category_name': category_info.name,
+            'date_of_update': data['date_of_update'],
+            'slug': data['slug'],
+            'impact': data['impact'],
+            'impact_label': impact_info.label,
+            'summary': _html_escape(data['summary']),
+        })
 
-    def update_main_news_page(self, data: Dict):
-        """Update the main news page with new article"""
+    def update_main_news_page(self, batch: List[Dict]):
+        """Update the main news page with new articles"""
         index_path = self.news_path / "index.html"
         if not index_path.exists():
             return
-        
+
         # Read current content
         with open(index_path, "r", encoding="utf-8") as f:
             content = f.read()
-        
-        # Add to recent news section
-        recent_news_pattern = r'(<div class="recent-news">\s*<h3>🔥 Recent News</h3>)'
-        new_article_html = self.generate_recent_news_html(data)
-        content = re.sub(recent_news_pattern, r'\1\n' + new_article_html, content)
-        
+
+        # Cheap substring guard: bail before any regex or splice work on
+        # pages that have neither the marker nor the legacy anchor
+        if _RECENT_MARKER not in content and '<div class="recent-news">' not in content:
+            return
+
+        # Add to recent news section at the fixed marker (plain substring
+        # replace); seed the marker at the legacy header if missing
+        if _RECENT_MARKER not in content:
+            content = _RECENT_NEWS_RE.sub(r'\1\n' + _RECENT_MARKER, content, count=1)
+        new_articles_html = ''.join(self.generate_recent_news_html(d) for d in batch)
+        content = content.replace(_RECENT_MARKER, new_articles_html + _RECENT_MARKER, 1)
+
         # Write updated content
         with open(index_path, "w", encoding="utf-8") as f:
             f.write(content)
 
     def generate_recent_news_html(self, data: Dict) -> str:
         """Generate HTML for recent news section"""
-        category_info = self.categories[data['category']]
-        
-        return f"""
-                    <div class="news-item">
-                        <div class="news-item-title">
-                            <a href="daily/{data['category']}/{data['date_of_update']}/{data['slug']}/">{data['headline']}</a>
-                        </div>
-                        <div class="news-item-meta">
-                            <span class="news-category-badge">{category_info['name']}</span>
-                            <span>{data['date_of_update']}</span>
-                        </div>
-                    </div>"""
+        category_info = data['_category_info']
 
-    def update_category_index(self, data: Dict):
-        """Update the category index page"""
-        category_index_path = self.news_path / "daily" / data['category'] / "index.html"
-        if not category_index_path.exists():
-            return
-        
-        # Read current content
-        with open(category_index_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        
-        # Add new article to the list
-        article_list_pattern = r'(<div class="news-list">)'
-        new_article_html = self.generate_category_article_html(data)
-        content = re.sub(article_list_pattern, r'\1\n' + new_article_html, content)
-        
-        # Write updated content
-        with open(category_index_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        return _render(_RECENT_ITEM_SEGMENTS, {
+            'category': data['category'],
+            'category_name': category_info.name,
+            'date_of_update': data['date_of_update'],
+            'slug': data['slug'],
+            'headline': _html_escape(data['headline']),
+        })
+
+    def update_category_index(self, batch: List[Dict]):
+        """Update the category index pages, one write per category"""
+        by_category: Dict[str, List[Dict]] = {}
+        for data in batch:
+            by_category.setdefault(data['category'], []).append(data)
+
+        for category, items in by_category.items():
+            category_index_path = self.news_path / "daily" / category / "index.html"
+            if not category_index_path.exists():
+                continue
+
+            # Read current content
+            with open(category_index_path, "r", encoding="utf-8") as f:
+                content = f.read()
+
+            # Same guard as the main page: skip files with no insert point
+            if _LIST_MARKER not in content and '<div class="news-list">' not in content:
+                continue
+
+            # Add new articles to the list at the fixed marker
+            if _LIST_MARKER not in content:
+                content = _ARTICLE_LIST_RE.sub(r'\1\n' + _LIST_MARKER, content, count=1)
+            new_articles_html = ''.join(self.generate_category_article_html(d) for d in items)
+            content = content.replace(_LIST_MARKER, new_articles_html + _LIST_MARKER, 1)
+
+            # Write updated content
+            with open(category_index_path, "w", encoding="utf-8") as f:
+                f.write(content)
 
     def generate_category_article_html(self, data: Dict) -> str:
         """Generate HTML for category article list"""
-        impact_info = self.impact_levels[data['impact']]
-        
-        return f"""
-                <article class="news-item">
-                    <div class="news-meta">
-                        <span>📅 {data['date_of_update']}</span>
-                        <span class="impact-badge impact-{data['impact']}">{impact_info['label']}</span>
-                        <span>🇨🇦 {data['source']}</span>
-                    </div>
-                    <h4><a href="{data['date_of_update']}/{data['slug']}/" style="color: var(--gray-900); text-decoration: none;">{data['headline']}</a></h4>
-                    <p>{data['summary']}</p>
-                    <a href="{data['date_of_update']}/{data['slug']}/" style="color: var(--primary-600); text-decoration: none; font-weight: 600; display: inline-block; margin-top: 1rem;">📖 Read Full Analysis →</a>
-                </article>"""
+        impact_info = data['_impact_info']
+
+        return _render(_CATEGORY_ITEM_SEGMENTS, {
+            'date_of_update': data['date_of_update'],
+            'impact': data['impact'],
+            'impact_label': impact_info.label,
+            'source': _html_escape(data['source']),
+            'slug': data['slug'],
+            'headline': _html_escape(data['headline']),
+            'summary': _html_escape(data['summary']),
+        })
+
+    def _get_http(self):
+        """Lazily import requests and build the pooled session"""
+        if self._http is None:
+            import requests
+            self._http = requests.Session()
+            self._http.mount('https://', requests.adapters.HTTPAdapter(
+                pool_connections=4, pool_maxsize=4))
+        return self._http
 
     def send_slack_notification(self, data: Dict, article_url: str, success: bool = True):
         """Send Slack notification about article publication"""
@@ -846,11 +993,11 @@ class NewsAutomationSystem:
                         "fields": [
                             {
                                 "type": "mrkdwn",
-                                "text": f"*Category:*\n{self.categories[data['category']]['name']}"
+                                "text": f"*Category:*\n{self.categories[data['category']].name}"
                             },
                             {
                                 "type": "mrkdwn",
-                                "text": f"*Impact:*\n{self.impact_levels[data['impact']]['label']}"
+                                "text": f"*Impact:*\n{self.impact_levels[data['impact']].label}"
                             },
                             {
                                 "type": "mrkdwn",
@@ -913,7 +1060,7 @@ class NewsAutomationSystem:
             }
         
         try:
-            response = requests.post(self.slack_webhook, json=message)
+            response = self._get_http().post(self.slack_webhook, json=message, timeout=10)
             response.raise_for_status()
             print("Slack notification sent successfully")
         except Exception as e:
@@ -961,18 +1108,16 @@ class NewsAutomationSystem:
             if not data:
                 return False
             
-            # Generate article content
-            content = self.generate_article_content(data)
-            
             # Create directory structure
             article_path = self.create_article_directory(data)
-            
-            # Write article file
-            if not self.write_article_file(article_path, content):
+
+            # Stream the rendered article straight into its file
+            if not self.write_article(article_path, data):
                 return False
             
             # Update page counts and links
-            if not self.update_page_counts(data):
+            self.update_page_counts(data)
+            if not self.flush_page_updates():
                 return False
             
             # Generate article URL
@@ -988,6 +1133,66 @@ class NewsAutomationSystem:
             self.handle_error(f"Publication error: {str(e)}", json_data)
             return False
 
+    def publish_articles(self, json_records: List[Dict]) -> bool:
+        """Publish a batch of articles with a single index-page flush.
+
+        Publishing N articles one by one costs N read/write cycles per
+        index file; here all page updates queue up and each index is
+        touched once at the end.
+        """
+        ok = True
+        for json_data in json_records:
+            try:
+                data = self.process_airtable_data(json_data)
+                if not data:
+                    ok = False
+                    continue
+                article_path = self.create_article_directory(data)
+                if not self.write_article(article_path, data):
+                    ok = False
+                    continue
+                self.update_page_counts(data)
+            except Exception as e:
+                self.handle_error(f"Publication error: {str(e)}", json_data)
+                ok = False
+        if not self.flush_page_updates():
+            ok = False
+        return ok
+
+    def build_all(self, records: List[Dict]) -> bool:
+        """Rebuild many articles at once, rendering across CPU cores.
+
+        Template expansion is pure CPU-bound Python with no shared state
+        between articles, so workers render in parallel; the parent
+        serializes the filesystem writes and the index-page flush.
+        """
+        with ProcessPoolExecutor() as executor:
+            for result in executor.map(_build_one, records, chunksize=16):
+                if result is None:
+                    continue
+                data, html = result
+                article_path = self.create_article_directory(data)
+                if self.write_article_file(article_path, html):
+                    self.update_page_counts(data)
+        return self.flush_page_updates()
+
+
+# Per-worker automation system, constructed lazily on first task so the
+# category tables and compiled template segments are set up once per process
+_WORKER_SYSTEM = None
+
+
+def _build_one(record: Dict) -> Optional[Tuple[Dict, str]]:
+    """Render one article in a worker process"""
+    global _WORKER_SYSTEM
+    if _WORKER_SYSTEM is None:
+        _WORKER_SYSTEM = NewsAutomationSystem()
+    data = _WORKER_SYSTEM.process_airtable_data(record)
+    if data is None:
+        return None
+    return data, _WORKER_SYSTEM.generate_article_content(data)
+
+
 def main():
     """Main function to run the automation system"""
     try:
@@ -997,7 +1202,10 @@ def main():
             with open(os.getenv('GITHUB_EVENT_PATH'), 'r') as f:
                 event_data = json.load(f)
             
-            print("📊 Full event data: " + json.dumps(event_data, indent=2))
+            # Pretty-printing the whole event is only worth the encode
+            # when someone is actually debugging a payload
+            if os.getenv('AUTOMATION_DEBUG'):
+                print("📊 Full event data: " + json.dumps(event_data, indent=2))
             
             # Extract data from GitHub event
             event_type = event_data.get('action') or event_data.get('event_type')
@@ -1020,19 +1228,37 @@ def main():
             with open(json_file, 'r', encoding='utf-8') as f:
                 json_data = json.load(f)
         
-        # Initialize and run automation system
+        # Pull the fields used below into locals once instead of
+        # re-hashing the same keys in every output f-string
+        if isinstance(json_data, dict):
+            category = json_data.get('category', '')
+            date_of_update = json_data.get('date_of_update', '')
+            headline = json_data.get('headline', '')
+        else:
+            category = date_of_update = headline = ''
+
+        # Initialize and run automation system; a JSON array publishes
+        # the whole batch with one index flush
         automation = NewsAutomationSystem()
-        success = automation.publish_article(json_data)
+        if isinstance(json_data, list):
+            success = automation.publish_articles(json_data)
+        else:
+            success = automation.publish_article(json_data)
         
         if success:
             print("🎉 Article published successfully!")
             
             # Output for GitHub Actions
             if os.getenv('GITHUB_OUTPUT'):
+                if isinstance(json_data, dict):
+                    # Slugify once; both output lines reuse the same value
+                    slug = automation.generate_slug(headline)
+                    article_url = f"https://immiwatch.ca/news/daily/{category}/{date_of_update}/{slug}/"
+                    output = f"success=true\narticle_url={article_url}\nslug={slug}\n"
+                else:
+                    output = f"success=true\npublished={len(json_data)}\n"
                 with open(os.getenv('GITHUB_OUTPUT'), 'a') as f:
-                    f.write(f"success=true\n")
-                    f.write(f"article_url=https://immiwatch.ca/news/daily/{json_data.get('category', '')}/{json_data.get('date_of_update', '')}/{automation.generate_slug(json_data.get('headline', ''))}/\n")
-                    f.write(f"slug={automation.generate_slug(json_data.get('headline', ''))}\n")
+                    f.write(output)
             
             sys.exit(0)
         else:
@@ -1041,8 +1267,7 @@ def main():
             # Output for GitHub Actions
             if os.getenv('GITHUB_OUTPUT'):
                 with open(os.getenv('GITHUB_OUTPUT'), 'a') as f:
-                    f.write(f"success=false\n")
-                    f.write(f"error=Article publication failed\n")
+                    f.write("success=false\nerror=Article publication failed\n")
             
             sys.exit(1)
             
@@ -1052,8 +1277,7 @@ def main():
         # Output for GitHub Actions
         if os.getenv('GITHUB_OUTPUT'):
             with open(os.getenv('GITHUB_OUTPUT'), 'a') as f:
-                f.write(f"success=false\n")
-                f.write(f"error={str(e)}\n")
+                f.write(f"success=false\nerror={str(e)}\n")
         
         sys.exit(1)
 
@@ -4,9 +4,81 @@ Template Generator for ImmiWatch
 Generates navigation and footer with correct relative paths based on file location.
 """
 
+import functools
+import hashlib
+import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Rendered nav/footer persisted between runs; reruns with unchanged
+# templates skip rendering entirely
+_CACHE_FILE = Path('.cache/templates.json')
+
+
+@functools.lru_cache(maxsize=16)
+def _paths_by_depth(depth):
+    """Relative paths to the site roots for a given directory depth"""
+    if depth == 0:  # Root level
+        return {
+            'home_path': './',
+            'reports_path': './reports/',
+            'tools_path': './tools/',
+            'news_path': './news/',
+            'about_path': './about/',
+            'updates_path': './updates/'
+        }
+    # Calculate relative paths based on depth
+    prefix = '../' * depth
+    return {
+        'home_path': f'{prefix}',
+        'reports_path': f'{prefix}reports/',
+        'tools_path': f'{prefix}tools/',
+        'news_path': f'{prefix}news/',
+        'about_path': f'{prefix}about/',
+        'updates_path': f'{prefix}updates/'
+    }
+
+# Directories that never contain site pages; pruned before descent.
+# scripts holds the master report/news templates and _includes holds the
+# Jekyll partials — rewriting either would bake one page's relative
+# paths into every page generated from them.
+_SKIP_DIRS = {'node_modules', '.git', '.venv', 'scripts', '_includes'}
+
+
+def _iter_html(root='.'):
+    """Yield HTML file paths below root, pruning excluded directories.
+
+    os.scandir reuses the dirent type information, so this avoids the
+    extra stat per entry that Path.rglob pays and never descends into
+    node_modules at all.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            name = entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if name in _SKIP_DIRS or name.startswith('.'):
+                    continue
+                yield from _iter_html(entry.path)
+            elif name.endswith('.html') and not name.startswith('.'):
+                yield entry.path
+
+
+def _splice(content, open_tag, close_tag, replacement):
+    """Replace the first open_tag...close_tag block with replacement.
+
+    The nav and footer markers are unique literals, so two
+    str.partition passes produce the before/after slices directly —
+    a linear C-level scan with no regex state machine or backtracking.
+    """
+    before, sep, rest = content.partition(open_tag)
+    if not sep:
+        return content
+    _, sep, after = rest.partition(close_tag)
+    if not sep:
+        return content
+    return before + replacement + after
+
 class TemplateGenerator:
     def __init__(self):
         self.nav_template = """<nav class="navbar">
@@ -69,64 +141,97 @@ class TemplateGenerator:
     </div>
 </footer>"""
 
+        # Rendered nav/footer depend only on depth; memoize per depth and
+        # preload from the on-disk cache when the templates are unchanged
+        self._template_hash = hashlib.md5(
+            (self.nav_template + self.footer_template).encode('utf-8')
+        ).hexdigest()
+        self._nav_cache = {}
+        self._footer_cache = {}
+        self._cache_dirty = False
+        try:
+            cached = json.loads(_CACHE_FILE.read_text(encoding='utf-8'))
+            if cached.get('template_hash') == self._template_hash:
+                self._nav_cache = {int(k): v for k, v in cached['nav'].items()}
+                self._footer_cache = {int(k): v for k, v in cached['footer'].items()}
+        except (OSError, ValueError, KeyError):
+            pass
+
     def calculate_paths(self, file_path):
         """Calculate relative paths from file location to root"""
-        file_path = Path(file_path)
-        depth = len(file_path.parts) - 1
-        
-        if depth == 0:  # Root level
-            return {
-                'home_path': './',
-                'reports_path': './reports/',
-                'tools_path': './tools/',
-                'news_path': './news/',
-                'about_path': './about/',
-                'updates_path': './updates/'
-            }
-        else:
-            # Calculate relative paths based on depth
-            prefix = '../' * depth
-            return {
-                'home_path': f'{prefix}',
-                'reports_path': f'{prefix}reports/',
-                'tools_path': f'{prefix}tools/',
-                'news_path': f'{prefix}news/',
-                'about_path': f'{prefix}about/',
-                'updates_path': f'{prefix}updates/'
-            }
+        return _paths_by_depth(len(Path(file_path).parts) - 1)
+
+    def _nav_by_depth(self, depth):
+        rendered = self._nav_cache.get(depth)
+        if rendered is None:
+            rendered = self.nav_template.format(**_paths_by_depth(depth))
+            self._nav_cache[depth] = rendered
+            self._cache_dirty = True
+        return rendered
+
+    def _footer_by_depth(self, depth):
+        rendered = self._footer_cache.get(depth)
+        if rendered is None:
+            rendered = self.footer_template.format(**_paths_by_depth(depth))
+            self._footer_cache[depth] = rendered
+            self._cache_dirty = True
+        return rendered
+
+    def _save_cache(self):
+        """Persist the per-depth renders for the next run"""
+        if not self._cache_dirty:
+            return
+        try:
+            _CACHE_FILE.parent.mkdir(exist_ok=True)
+            _CACHE_FILE.write_text(json.dumps({
+                'template_hash': self._template_hash,
+                'nav': self._nav_cache,
+                'footer': self._footer_cache,
+            }), encoding='utf-8')
+            self._cache_dirty = False
+        except OSError as e:
+            print(f"⚠️ Could not save template cache: {e}")
 
     def generate_nav(self, file_path):
         """Generate navigation HTML for a specific file"""
-        paths = self.calculate_paths(file_path)
-        return self.nav_template.format(**paths)
+        return self._nav_by_depth(len(Path(file_path).parts) - 1)
 
     def generate_footer(self, file_path):
         """Generate footer HTML for a specific file"""
-        paths = self.calculate_paths(file_path)
-        return self.footer_template.format(**paths)
+        return self._footer_by_depth(len(Path(file_path).parts) - 1)
 
     def update_file(self, file_path):
         """Update navigation and footer in a single file"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Generate new nav and footer
-            new_nav = self.generate_nav(file_path)
-            new_footer = self.generate_footer(file_path)
-            
-            # Replace existing nav (simple pattern matching)
-            nav_pattern = r'<nav class="navbar">.*?</nav>'
-            content = re.sub(nav_pattern, new_nav, content, flags=re.DOTALL)
-            
-            # Replace existing footer
-            footer_pattern = r'<footer class="footer">.*?</footer>'
-            content = re.sub(footer_pattern, new_footer, content, flags=re.DOTALL)
-            
+            file_path = Path(file_path)
+            content = file_path.read_text(encoding='utf-8')
+
+            # Partials carry neither tag; skip them before rendering
+            has_nav = '<nav class="navbar">' in content
+            has_footer = '<footer class="footer">' in content
+            if not (has_nav or has_footer):
+                return
+
+            # Generate new nav and footer once per depth across the run,
+            # splicing only the tags actually present
+            depth = len(file_path.parts) - 1
+            new_content = content
+            if has_nav:
+                new_content = _splice(new_content, '<nav class="navbar">', '</nav>',
+                                      self._nav_by_depth(depth))
+            if has_footer:
+                new_content = _splice(new_content, '<footer class="footer">', '</footer>',
+                                      self._footer_by_depth(depth))
+
+            # Skip the write (and the mtime bump) when nothing changed —
+            # on a full-tree run most files are already up to date
+            if new_content == content:
+                print(f"⏭️ Unchanged: {file_path}")
+                return
+
             # Write back to file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
+            file_path.write_text(new_content, encoding='utf-8')
+
             print(f"✅ Updated: {file_path}")
             
         except Exception as e:
@@ -134,17 +239,16 @@ class TemplateGenerator:
 
     def update_all_files(self):
         """Update all HTML files in the project"""
-        import re
-        
-        html_files = []
-        for file_path in Path('.').rglob("*.html"):
-            if not file_path.name.startswith(".") and "node_modules" not in str(file_path):
-                html_files.append(file_path)
-        
+        html_files = list(_iter_html('.'))
+
         print(f"Found {len(html_files)} HTML files to update")
-        
-        for file_path in html_files:
-            self.update_file(file_path)
+
+        # File IO releases the GIL, so a thread pool overlaps the reads
+        # and writes across the tree
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4)) as executor:
+            list(executor.map(self.update_file, html_files))
+
+        self._save_cache()
 
 def main():
     generator = TemplateGenerator()
@@ -14,18 +14,119 @@ Example:
     python3 scripts/update_monthly_report.py 2025-08 --draw-data august_draw_2.json
 """
 
+import functools
 import os
 import sys
-import json
 import re
+from dataclasses import dataclass, replace
 from datetime import datetime
 from pathlib import Path
 import argparse
 
+from _json_compat import loads as _json_loads
+
+# These patterns run on every update_report() call (the stat-number one four
+# times in a row), so compile them once at import instead of re-parsing the
+# pattern strings on each re.sub/re.findall invocation.
+_STAT_NUMBER_RE = re.compile(r'<div class="stat-number" data-target="\d+" data-prefix="" data-suffix="">\d+</div>')
+# DOTALL so a summary that wraps onto multiple lines still matches; the
+# non-greedy body stops at the first closing </p>
+_EXEC_SUMMARY_RE = re.compile(r'<p class="executive-summary">.*?</p>', re.DOTALL)
+_PROGRAM_ROW_RE = re.compile(r'<td>(\d+)</td>\s*<td>(\d+\.?\d*)%</td>\s*<td>.*?</td>')
+_STAT_TARGET_RE = re.compile(r'data-target="(\d+)"')
+
+# Fixed literal, so a plain substring find beats the regex engine
+_HERO_STATS_OPEN = '<div class="hero-stats">'
+
+# One template shared by every stat-card rewrite; C-level format fills
+# both slots from a single value
+_STAT_TEMPLATE = '<div class="stat-number" data-target="{v}" data-prefix="" data-suffix="">{v}</div>'
+
+# Executive summary templates indexed by min(draw_count, 4); index 0 is
+# unused since a month with no draws falls through to the steady-pace text
+_SUMMARY_TEMPLATES = (
+    None,
+    "**🏗️ Executive Summary:** {month} {year} begins with {total} ITAs issued in the first draw, establishing the month's foundation with {cec} CEC and {pnp} PNP selections.",
+    "**📈 Executive Summary:** {month} {year} continues with {total} total ITAs across {draws} draws, showing {growth}% growth from the first draw.",
+    "**🚀 Executive Summary:** {month} {year} demonstrates strong momentum with {total} ITAs across {draws} draws, indicating consistent immigration activity.",
+    "**📊 Executive Summary:** {month} {year} maintains steady pace with {total} ITAs across {draws} draws, reflecting sustained immigration strategy.",
+)
+
+_MONTH_NAMES = {
+    1: "January", 2: "February", 3: "March", 4: "April",
+    5: "May", 6: "June", 7: "July", 8: "August",
+    9: "September", 10: "October", 11: "November", 12: "December"
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _month_info(month_str):
+    """Month metadata for a YYYY-MM string, cached across repeated draws"""
+    year, month = month_str.split("-")
+    month_num = int(month)
+    month_name = _MONTH_NAMES[month_num]
+    return {
+        "year": year,
+        "month_num": month_num,
+        "month_name": month_name,
+        "month_str": month_str,
+        "directory": f"ee-{month_name.lower()}-{year}"
+    }
+
+def _pct3(total, cec, pnp, category):
+    """Shares of total for the three headline aggregates, in percent"""
+    if not total:
+        return 0.0, 0.0, 0.0
+    inv = 100.0 / total
+    return round(cec * inv, 1), round(pnp * inv, 1), round(category * inv, 1)
+
+
+@dataclass(slots=True)
+class DrawTotals:
+    """Running totals for a month of draws.
+
+    Slots make every field read/write a fixed offset instead of a dict
+    lookup, which adds up across the merge and analysis passes.
+    """
+    total_itas: int = 0
+    cec_itas: int = 0
+    pnp_itas: int = 0
+    fsw_itas: int = 0
+    fst_itas: int = 0
+    category_based_total: int = 0
+    french_speaking: int = 0
+    healthcare: int = 0
+    stem: int = 0
+    trade: int = 0
+    education: int = 0
+    agriculture: int = 0
+    draw_count: int = 0
+    latest_draw_date: str = ""
+    latest_crs: int = 0
+
+
 class MonthlyReportUpdater:
+    # Program code -> (totals field, counts toward category-based draws);
+    # every program also counts toward total_itas
+    PROGRAM_MAP = {
+        "EE-PNP": ("pnp_itas", False),
+        "EE-CEC": ("cec_itas", False),
+        "EE-FSW": ("fsw_itas", False),
+        "EE-FST": ("fst_itas", False),
+        "EE-Health": ("healthcare", True),
+        "EE-French": ("french_speaking", True),
+        "EE-Trade": ("trade", True),
+        "EE-Education": ("education", True),
+        "EE-Agriculture": ("agriculture", True),
+        "EE-STEM": ("stem", True),
+    }
+
     def __init__(self):
         self.base_dir = Path("reports/express-entry")
-        
+        # (mtime, content) per report path so batch runs that update the
+        # same month repeatedly only hit the disk when the file changed
+        self._report_cache = {}
+
     def validate_month_format(self, month_str):
         """Validate month format (YYYY-MM)"""
         try:
@@ -36,81 +137,56 @@ class MonthlyReportUpdater:
     
     def get_month_info(self, month_str):
         """Extract month information from YYYY-MM format"""
-        year, month = month_str.split("-")
-        month_num = int(month)
-        
-        month_names = {
-            1: "January", 2: "February", 3: "March", 4: "April",
-            5: "May", 6: "June", 7: "July", 8: "August",
-            9: "September", 10: "October", 11: "November", 12: "December"
-        }
-        
-        month_name = month_names[month_num]
-        return {
-            "year": year,
-            "month_num": month_num,
-            "month_name": month_name,
-            "month_str": month_str,
-            "directory": f"ee-{month_name.lower()}-{year}"
-        }
-    
+        return _month_info(month_str)
+
     def load_existing_report(self, month_info):
         """Load existing monthly report"""
         report_file = self.base_dir / month_info["directory"] / "index.html"
         if not report_file.exists():
             raise FileNotFoundError(f"Report file not found: {report_file}")
-        
+
+        mtime = report_file.stat().st_mtime_ns
+        cached = self._report_cache.get(report_file)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
         with open(report_file, 'r', encoding='utf-8') as f:
-            return f.read()
+            content = f.read()
+        self._report_cache[report_file] = (mtime, content)
+        return content
     
     def load_draw_data(self, data_file):
         """Load new draw data"""
         if not os.path.exists(data_file):
             raise FileNotFoundError(f"Draw data file not found: {data_file}")
-        
-        with open(data_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+
+        with open(data_file, 'rb') as f:
+            return _json_loads(f.read())
     
     def extract_current_data(self, report_content):
         """Extract current data from existing report"""
         # Extract current statistics
-        current_data = {
-            "total_itas": 0,
-            "cec_itas": 0,
-            "pnp_itas": 0,
-            "fsw_itas": 0,
-            "fst_itas": 0,
-            "category_based_total": 0,
-            "french_speaking": 0,
-            "healthcare": 0,
-            "stem": 0,
-            "trade": 0,
-            "education": 0,
-            "agriculture": 0,
-            "draw_count": 0,
-            "latest_draw_date": "",
-            "latest_crs": 0
-        }
-        
+        current_data = DrawTotals()
+
         # Extract numbers from stat-number elements
-        stat_matches = re.findall(r'data-target="(\d+)"', report_content)
+        stat_matches = _STAT_TARGET_RE.findall(report_content)
         if len(stat_matches) >= 4:
             # Based on the July report structure:
             # First: Total ITAs (should be 7558)
             # Second: Healthcare (4000)
             # Third: PNP (3558)
             # Fourth: CEC (3000)
-            current_data["total_itas"] = int(stat_matches[0])  # First stat-number is total
-            current_data["healthcare"] = int(stat_matches[1])  # Second is healthcare
-            current_data["pnp_itas"] = int(stat_matches[2])    # Third is PNP
-            current_data["cec_itas"] = int(stat_matches[3])    # Fourth is CEC
-        
+            current_data.total_itas = int(stat_matches[0])  # First stat-number is total
+            current_data.healthcare = int(stat_matches[1])  # Second is healthcare
+            current_data.pnp_itas = int(stat_matches[2])    # Third is PNP
+            current_data.cec_itas = int(stat_matches[3])    # Fourth is CEC
+
         return current_data
     
     def merge_draw_data(self, current_data, new_draw_data):
         """Merge new draw data with existing data"""
-        updated_data = current_data.copy()
-        
+        updated_data = replace(current_data)
+
         # Handle Lambda webhook format
         if "body" in new_draw_data:
             # Lambda format
@@ -119,88 +195,61 @@ class MonthlyReportUpdater:
             invitations = body.get("Invitation", 0)
             crs_score = body.get("Score", 0)
             draw_date = body.get("draw.date.most.recent", "")
-            
+
             # Map program to the correct field
-            if program == "EE-PNP":
-                updated_data["pnp_itas"] += invitations
-                updated_data["total_itas"] += invitations
-            elif program == "EE-CEC":
-                updated_data["cec_itas"] += invitations
-                updated_data["total_itas"] += invitations
-            elif program == "EE-FSW":
-                updated_data["fsw_itas"] += invitations
-                updated_data["total_itas"] += invitations
-            elif program == "EE-FST":
-                updated_data["fst_itas"] += invitations
-                updated_data["total_itas"] += invitations
-            elif program == "EE-Health":
-                updated_data["healthcare"] += invitations
-                updated_data["category_based_total"] += invitations
-                updated_data["total_itas"] += invitations
-            elif program == "EE-French":
-                updated_data["french_speaking"] += invitations
-                updated_data["category_based_total"] += invitations
-                updated_data["total_itas"] += invitations
-            elif program == "EE-Trade":
-                updated_data["trade"] += invitations
-                updated_data["category_based_total"] += invitations
-                updated_data["total_itas"] += invitations
-            elif program == "EE-Education":
-                updated_data["education"] += invitations
-                updated_data["category_based_total"] += invitations
-                updated_data["total_itas"] += invitations
-            elif program == "EE-Agriculture":
-                updated_data["agriculture"] += invitations
-                updated_data["category_based_total"] += invitations
-                updated_data["total_itas"] += invitations
-            elif program == "EE-STEM":
-                updated_data["stem"] += invitations
-                updated_data["category_based_total"] += invitations
-                updated_data["total_itas"] += invitations
-            
+            field, is_category = self.PROGRAM_MAP.get(program, (None, False))
+            if field:
+                setattr(updated_data, field, getattr(updated_data, field) + invitations)
+                if is_category:
+                    updated_data.category_based_total += invitations
+                updated_data.total_itas += invitations
+
             # Update draw count and latest info
-            updated_data["draw_count"] += 1
-            updated_data["latest_draw_date"] = draw_date
-            updated_data["latest_crs"] = crs_score
+            updated_data.draw_count += 1
+            updated_data.latest_draw_date = draw_date
+            updated_data.latest_crs = crs_score
         else:
             # Old format (fallback)
-            updated_data["total_itas"] += new_draw_data.get("itas", 0)
-            updated_data["cec_itas"] += new_draw_data.get("cec_itas", 0)
-            updated_data["pnp_itas"] += new_draw_data.get("pnp_itas", 0)
-            updated_data["fsw_itas"] += new_draw_data.get("fsw_itas", 0)
-            updated_data["fst_itas"] += new_draw_data.get("fst_itas", 0)
-            
+            updated_data.total_itas += new_draw_data.get("itas", 0)
+            updated_data.cec_itas += new_draw_data.get("cec_itas", 0)
+            updated_data.pnp_itas += new_draw_data.get("pnp_itas", 0)
+            updated_data.fsw_itas += new_draw_data.get("fsw_itas", 0)
+            updated_data.fst_itas += new_draw_data.get("fst_itas", 0)
+
             # Category-based draws
-            updated_data["category_based_total"] += new_draw_data.get("category_based_total", 0)
-            updated_data["french_speaking"] += new_draw_data.get("french_speaking", 0)
-            updated_data["healthcare"] += new_draw_data.get("healthcare", 0)
-            updated_data["stem"] += new_draw_data.get("stem", 0)
-            updated_data["trade"] += new_draw_data.get("trade", 0)
-            updated_data["education"] += new_draw_data.get("education", 0)
-            updated_data["agriculture"] += new_draw_data.get("agriculture", 0)
-            
+            updated_data.category_based_total += new_draw_data.get("category_based_total", 0)
+            updated_data.french_speaking += new_draw_data.get("french_speaking", 0)
+            updated_data.healthcare += new_draw_data.get("healthcare", 0)
+            updated_data.stem += new_draw_data.get("stem", 0)
+            updated_data.trade += new_draw_data.get("trade", 0)
+            updated_data.education += new_draw_data.get("education", 0)
+            updated_data.agriculture += new_draw_data.get("agriculture", 0)
+
             # Update draw count and latest info
-            updated_data["draw_count"] += 1
-            updated_data["latest_draw_date"] = new_draw_data.get("draw_date", "")
-            updated_data["latest_crs"] = new_draw_data.get("crs", 0)
-        
+            updated_data.draw_count += 1
+            updated_data.latest_draw_date = new_draw_data.get("draw_date", "")
+            updated_data.latest_crs = new_draw_data.get("crs", 0)
+
         return updated_data
     
     def generate_intelligent_analysis(self, month_info, updated_data, new_draw_data):
         """Generate intelligent analysis based on current state"""
         month_name = month_info["month_name"]
         year = month_info["year"]
-        draw_count = updated_data["draw_count"]
-        
-        # Generate executive summary based on current state
-        if draw_count == 1:
-            executive_summary = f"**🏗️ Executive Summary:** {month_name} {year} begins with {updated_data['total_itas']} ITAs issued in the first draw, establishing the month's foundation with {updated_data['cec_itas']} CEC and {updated_data['pnp_itas']} PNP selections."
-        elif draw_count == 2:
-            executive_summary = f"**📈 Executive Summary:** {month_name} {year} continues with {updated_data['total_itas']} total ITAs across {draw_count} draws, showing {self.calculate_growth_rate(updated_data)}% growth from the first draw."
-        elif draw_count == 3:
-            executive_summary = f"**🚀 Executive Summary:** {month_name} {year} demonstrates strong momentum with {updated_data['total_itas']} ITAs across {draw_count} draws, indicating consistent immigration activity."
-        else:
-            executive_summary = f"**📊 Executive Summary:** {month_name} {year} maintains steady pace with {updated_data['total_itas']} ITAs across {draw_count} draws, reflecting sustained immigration strategy."
+        draw_count = updated_data.draw_count
+
+        # Generate executive summary based on current state; extra format
+        # arguments are ignored by templates that don't use them
+        template = _SUMMARY_TEMPLATES[min(draw_count, 4) or 4]
+        executive_summary = template.format(
+            month=month_name,
+            year=year,
+            total=updated_data.total_itas,
+            cec=updated_data.cec_itas,
+            pnp=updated_data.pnp_itas,
+            draws=draw_count,
+            growth=self.calculate_growth_rate(updated_data),
+        )
         
         # Generate strategic insights
         strategic_insights = self.generate_strategic_insights(updated_data, new_draw_data)
@@ -222,174 +271,155 @@ class MonthlyReportUpdater:
     def generate_strategic_insights(self, updated_data, new_draw_data):
         """Generate strategic insights based on current data"""
         insights = []
-        
+
+        # Numeric kernel runs once; only the strings are assembled below
+        cec_percentage, pnp_percentage, category_percentage = _pct3(
+            updated_data.total_itas,
+            updated_data.cec_itas,
+            updated_data.pnp_itas,
+            updated_data.category_based_total,
+        )
+
         # CEC analysis
-        if updated_data["cec_itas"] > 0:
-            cec_percentage = round((updated_data["cec_itas"] / updated_data["total_itas"]) * 100, 1)
+        if updated_data.cec_itas > 0:
             insights.append(f"CEC candidates represent {cec_percentage}% of total selections, maintaining domestic experience priority.")
-        
+
         # PNP analysis
-        if updated_data["pnp_itas"] > 0:
-            pnp_percentage = round((updated_data["pnp_itas"] / updated_data["total_itas"]) * 100, 1)
+        if updated_data.pnp_itas > 0:
             insights.append(f"PNP selections at {pnp_percentage}% demonstrate continued federal-provincial coordination.")
-        
+
         # Category-based analysis
-        if updated_data["category_based_total"] > 0:
-            category_percentage = round((updated_data["category_based_total"] / updated_data["total_itas"]) * 100, 1)
+        if updated_data.category_based_total > 0:
             insights.append(f"Category-based draws represent {category_percentage}% of total ITAs, showing targeted immigration strategy.")
-        
+
         # CRS analysis
-        if updated_data["latest_crs"] > 0:
-            insights.append(f"Latest CRS score of {updated_data['latest_crs']} indicates current competition level in the pool.")
-        
+        if updated_data.latest_crs > 0:
+            insights.append(f"Latest CRS score of {updated_data.latest_crs} indicates current competition level in the pool.")
+
         return insights
     
     def generate_key_highlights(self, updated_data, new_draw_data):
         """Generate key highlights based on current data"""
         highlights = []
-        
-        highlights.append(f"{updated_data['total_itas']} Total ITAs")
-        highlights.append(f"{updated_data['cec_itas']} CEC")
-        highlights.append(f"{updated_data['pnp_itas']} PNP")
-        
-        if updated_data["category_based_total"] > 0:
-            highlights.append(f"{updated_data['category_based_total']} Category-Based")
-        
+
+        highlights.append(f"{updated_data.total_itas} Total ITAs")
+        highlights.append(f"{updated_data.cec_itas} CEC")
+        highlights.append(f"{updated_data.pnp_itas} PNP")
+
+        if updated_data.category_based_total > 0:
+            highlights.append(f"{updated_data.category_based_total} Category-Based")
+
         return highlights
     
     def update_report_content(self, report_content, month_info, updated_data, analysis):
         """Update report content with new data and analysis"""
-        content = report_content
-        
-        # Update statistics
-        content = self.update_statistics(content, updated_data)
-        
-        # Update executive summary
-        content = self.update_executive_summary(content, analysis["executive_summary"])
-        
-        # Update key highlights
-        content = self.update_key_highlights(content, analysis["key_highlights"])
-        
-        # Update program breakdown table
-        content = self.update_program_table(content, updated_data)
-        
-        # Update strategic analysis
-        content = self.update_strategic_analysis(content, analysis["strategic_insights"])
-        
-        # Update draw count indicator
-        content = self.update_draw_count(content, updated_data["draw_count"])
-        
-        return content
-    
-    def update_statistics(self, content, updated_data):
-        """Update the main statistics cards"""
-        # Update total ITAs (first stat-number)
-        content = re.sub(
-            r'<div class="stat-number" data-target="\d+" data-prefix="" data-suffix="">\d+</div>',
-            f'<div class="stat-number" data-target="{updated_data["total_itas"]}" data-prefix="" data-suffix="">{updated_data["total_itas"]}</div>',
-            content,
-            count=1
-        )
-        
-        # Update healthcare (second stat-number)
-        content = re.sub(
-            r'<div class="stat-number" data-target="\d+" data-prefix="" data-suffix="">\d+</div>',
-            f'<div class="stat-number" data-target="{updated_data["healthcare"]}" data-prefix="" data-suffix="">{updated_data["healthcare"]}</div>',
-            content,
-            count=1
-        )
-        
-        # Update PNP ITAs (third stat-number)
-        content = re.sub(
-            r'<div class="stat-number" data-target="\d+" data-prefix="" data-suffix="">\d+</div>',
-            f'<div class="stat-number" data-target="{updated_data["pnp_itas"]}" data-prefix="" data-suffix="">{updated_data["pnp_itas"]}</div>',
-            content,
-            count=1
-        )
-        
-        # Update CEC ITAs (fourth stat-number)
-        content = re.sub(
-            r'<div class="stat-number" data-target="\d+" data-prefix="" data-suffix="">\d+</div>',
-            f'<div class="stat-number" data-target="{updated_data["cec_itas"]}" data-prefix="" data-suffix="">{updated_data["cec_itas"]}</div>',
-            content,
-            count=1
+        # Every section edit is collected as a (start, end, replacement)
+        # span against the original string and the result is assembled with
+        # one join, so each pattern scans the source exactly once and only
+        # a single full-size copy is built — instead of one fresh copy per
+        # sequential re.sub pass.
+        edits = []
+
+        # Statistics cards: the first four stat-numbers are total,
+        # healthcare, PNP, and CEC (matching extract_current_data)
+        stat_values = (
+            updated_data.total_itas,
+            updated_data.healthcare,
+            updated_data.pnp_itas,
+            updated_data.cec_itas,
         )
-        
-        return content
-    
-    def update_executive_summary(self, content, executive_summary):
-        """Update executive summary"""
-        content = re.sub(
-            r'<p class="executive-summary">.*?</p>',
-            f'<p class="executive-summary">{executive_summary}</p>',
-            content
+        for match, value in zip(_STAT_NUMBER_RE.finditer(report_content), stat_values):
+            edits.append((match.start(), match.end(), _STAT_TEMPLATE.format(v=value)))
+
+        # Executive summary
+        match = _EXEC_SUMMARY_RE.search(report_content)
+        if match:
+            edits.append((
+                match.start(), match.end(),
+                f'<p class="executive-summary">{analysis["executive_summary"]}</p>'
+            ))
+
+        # Program breakdown table
+        program_row = (
+            f'<td>{updated_data.total_itas}</td>\n'
+            f'            <td>100%</td>\n'
+            f'            <td>Monthly Progress ({updated_data.draw_count} draws)</td>'
         )
-        
+        for match in _PROGRAM_ROW_RE.finditer(report_content):
+            edits.append((match.start(), match.end(), program_row))
+
+        # Draw count indicator, inserted just inside the hero stats block
+        pos = report_content.find(_HERO_STATS_OPEN)
+        if pos >= 0:
+            pos += len(_HERO_STATS_OPEN)
+            draw_count = updated_data.draw_count
+            draw_indicator = f'<div class="draw-count">📊 {draw_count} Draw{"s" if draw_count > 1 else ""} This Month</div>'
+            edits.append((pos, pos, f'\n        {draw_indicator}'))
+
+        content = self._apply_edits(report_content, edits)
+
+        # Placeholder sections still flow through their hooks
+        content = self.update_key_highlights(content, analysis["key_highlights"])
+        content = self.update_strategic_analysis(content, analysis["strategic_insights"])
+
         return content
-    
+
+    @staticmethod
+    def _apply_edits(content, edits):
+        """Splice (start, end, replacement) edits into content in one pass"""
+        if not edits:
+            return content
+
+        edits.sort(key=lambda edit: edit[0])
+        pieces = []
+        pos = 0
+        for start, end, replacement in edits:
+            if start < pos:
+                # Overlapping spans: the earlier edit wins
+                continue
+            pieces.append(content[pos:start])
+            pieces.append(replacement)
+            pos = end
+        pieces.append(content[pos:])
+        return ''.join(pieces)
+
     def update_key_highlights(self, content, key_highlights):
         """Update key highlights section"""
         # This would need more sophisticated parsing
         return content
-    
-    def update_program_table(self, content, updated_data):
-        """Update the program breakdown table"""
-        # Calculate percentages
-        total = updated_data["total_itas"]
-        if total > 0:
-            cec_pct = round((updated_data["cec_itas"] / total) * 100, 1)
-            pnp_pct = round((updated_data["pnp_itas"] / total) * 100, 1)
-        else:
-            cec_pct = pnp_pct = 0
-        
-        # Update table data
-        content = re.sub(
-            r'<td>(\d+)</td>\s*<td>(\d+\.?\d*)%</td>\s*<td>.*?</td>',
-            f'<td>{updated_data["total_itas"]}</td>\n            <td>100%</td>\n            <td>Monthly Progress ({updated_data["draw_count"]} draws)</td>',
-            content
-        )
-        
-        return content
-    
+
     def update_strategic_analysis(self, content, strategic_insights):
         """Update strategic analysis section"""
         # This would need more sophisticated parsing
         return content
     
-    def update_draw_count(self, content, draw_count):
-        """Update draw count indicator"""
-        # Add or update draw count indicator
-        draw_indicator = f'<div class="draw-count">📊 {draw_count} Draw{"s" if draw_count > 1 else ""} This Month</div>'
-        
-        # Find a good place to insert the draw count
-        if '<div class="hero-stats">' in content:
-            content = re.sub(
-                r'<div class="hero-stats">',
-                f'<div class="hero-stats">\n        {draw_indicator}',
-                content
-            )
-        
-        return content
-    
-    def update_report(self, month_str, draw_data_file):
-        """Update existing monthly report with new draw data"""
+    def update_report(self, month_str, draw_data):
+        """Update existing monthly report with new draw data.
+
+        draw_data is either the draw dict itself or a path to a JSON file
+        holding it; in-process callers pass the dict and skip the disk
+        round trip entirely.
+        """
         print(f"🔄 Updating Express Entry report for {month_str}...")
-        
+
         # Validate month format
         if not self.validate_month_format(month_str):
             raise ValueError(f"Invalid month format: {month_str}. Use YYYY-MM format.")
-        
+
         # Get month information
         month_info = self.get_month_info(month_str)
         print(f"📅 Month: {month_info['month_name']} {month_info['year']}")
-        
+
         # Load existing report
         print("📄 Loading existing report...")
         report_content = self.load_existing_report(month_info)
-        
+
         # Load new draw data
         print("📊 Loading new draw data...")
-        new_draw_data = self.load_draw_data(draw_data_file)
+        if isinstance(draw_data, dict):
+            new_draw_data = draw_data
+        else:
+            new_draw_data = self.load_draw_data(draw_data)
         
         # Extract current data
         print("🔍 Extracting current data...")
@@ -414,7 +444,7 @@ class MonthlyReportUpdater:
         
         print(f"✅ Report updated successfully!")
         print(f"📁 Location: {report_file}")
-        print(f"📊 New totals: {updated_data['total_itas']} ITAs across {updated_data['draw_count']} draws")
+        print(f"📊 New totals: {updated_data.total_itas} ITAs across {updated_data.draw_count} draws")
         print(f"🌐 URL: https://immiwatch.ca/reports/express-entry/{month_info['directory']}/")
         
         return report_file
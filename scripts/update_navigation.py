@@ -4,47 +4,90 @@ Navigation Update Script for ImmiWatch
 Automatically updates navigation menus and footers across all HTML files.
 """
 
+import mmap
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+
+def _walk_html(root):
+    """Yield HTML file paths below root, pruning excluded directories.
+
+    Unlike rglob + post-filter, this never descends into node_modules or
+    dot-directories, so their contents cost no directory reads at all.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            name = entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if name.startswith(".") or name == "node_modules":
+                    continue
+                yield from _walk_html(entry.path)
+            elif name.endswith(".html") and not name.startswith("."):
+                yield Path(entry.path)
+
+def _process_file(args):
+    """Worker for update_navigation: probe, replace, and rewrite one file.
+
+    Module-level so ProcessPoolExecutor can pickle it for worker processes.
+    """
+    file_path, old_text, new_text = args
+    try:
+        # Probe the raw bytes first: most files don't contain the target
+        # string, and the mmap scan rejects them without decoding UTF-8
+        # or allocating a full str.
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(old_text.encode('utf-8')) < 0:
+                    return None
+
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        # Replace the text; CPython hands back the same object when
+        # nothing matched, so an identity check skips the rewrite without
+        # a second scan of the content
+        new_content = content.replace(old_text, new_text)
+        if new_content is content:
+            return None
+
+        # Write back to file
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(new_content)
+
+        print(f"✅ Updated: {file_path}")
+        return file_path
+
+    except Exception as e:
+        print(f"❌ Error updating {file_path}: {e}")
+        return None
+
+
 class NavigationUpdater:
     def __init__(self, root_dir="."):
         self.root_dir = Path(root_dir)
         self.html_files = []
-        
+
     def find_html_files(self):
         """Find all HTML files in the project"""
-        for file_path in self.root_dir.rglob("*.html"):
-            if not file_path.name.startswith(".") and "node_modules" not in str(file_path):
-                self.html_files.append(file_path)
+        self.html_files = list(_walk_html(self.root_dir))
         print(f"Found {len(self.html_files)} HTML files")
         
     def update_navigation(self, old_text, new_text):
         """Update navigation menu text across all files"""
-        updated_files = []
-        
-        for file_path in self.html_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Check if file contains the old text
-                if old_text in content:
-                    # Replace the text
-                    new_content = content.replace(old_text, new_text)
-                    
-                    # Write back to file
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(new_content)
-                    
-                    updated_files.append(file_path)
-                    print(f"✅ Updated: {file_path}")
-                    
-            except Exception as e:
-                print(f"❌ Error updating {file_path}: {e}")
-        
-        return updated_files
+        # Files are independent, so fan the read-scan-write loop out across
+        # cores; processes rather than threads keep the string scans clear
+        # of the GIL.
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(
+                _process_file,
+                [(file_path, old_text, new_text) for file_path in self.html_files],
+                chunksize=32
+            )
+            return [file_path for file_path in results if file_path is not None]
     
     def update_footer(self, old_text, new_text):
         """Update footer links across all files"""
@@ -57,11 +100,44 @@ class NavigationUpdater:
     def batch_update(self, updates):
         """Perform multiple updates at once"""
         self.find_html_files()
-        
-        for update_type, old_text, new_text in updates:
-            print(f"\n🔄 Updating {update_type}...")
-            updated_files = self.update_navigation(old_text, new_text)
-            print(f"📊 Updated {len(updated_files)} files for {update_type}")
+
+        # Apply every rule in one traversal per file: an alternation of the
+        # escaped needles drives a single scan, so each file is read,
+        # decoded, and written at most once instead of once per rule.
+        mapping = {old_text: new_text for _, old_text, new_text in updates}
+        pattern = re.compile('|'.join(re.escape(old_text) for old_text in mapping))
+        needles = [old_text.encode('utf-8') for old_text in mapping]
+
+        print(f"\n🔄 Applying {len(updates)} updates...")
+        updated_files = []
+
+        for file_path in self.html_files:
+            try:
+                with open(file_path, 'rb') as f:
+                    if os.fstat(f.fileno()).st_size == 0:
+                        continue
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if all(mm.find(needle) < 0 for needle in needles):
+                            continue
+
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+
+                new_content = pattern.sub(lambda m: mapping[m.group(0)], content)
+                if new_content == content:
+                    continue
+
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    f.write(new_content)
+
+                updated_files.append(file_path)
+                print(f"✅ Updated: {file_path}")
+
+            except Exception as e:
+                print(f"❌ Error updating {file_path}: {e}")
+
+        print(f"📊 Updated {len(updated_files)} files")
+        return updated_files
 
 def main():
     updater = NavigationUpdater()
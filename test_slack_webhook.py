@@ -7,6 +7,11 @@ import os
 import requests
 import json
 
+# One pooled session for the whole script: repeat posts reuse the TCP/TLS
+# connection instead of paying a fresh handshake each time
+SESSION = requests.Session()
+SESSION.mount('https://', requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=10))
+
 def test_slack_webhook():
     """Test if Slack webhook is accessible"""
     
@@ -24,7 +29,7 @@ def test_slack_webhook():
     }
     
     try:
-        response = requests.post(webhook_url, json=test_message, timeout=10)
+        response = SESSION.post(webhook_url, json=test_message, timeout=10)
         
         if response.status_code == 200:
             print("✅ Slack webhook test successful!")